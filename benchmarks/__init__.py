@@ -0,0 +1 @@
+"""Offline simulator and benchmarks for the Sony SDCP integration."""
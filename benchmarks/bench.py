@@ -0,0 +1,200 @@
+"""Latency benchmark of the Sony SDCP integration against the simulator.
+
+Drives coordinator refreshes and the select, switch and button write paths
+against a SimulatedProjector and reports p50/p99 latency and commands per
+second for each. Run from the repository root:
+
+    python -m benchmarks.bench --latency 0.02 --iterations 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+import json
+import logging
+import tempfile
+import time
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.sony_sdcp.button import SonySDCPIRButton
+from custom_components.sony_sdcp.const import (
+    CALIBRATION_PRESETS,
+    CONF_CAPABILITIES,
+    DOMAIN,
+)
+from custom_components.sony_sdcp.coordinator import SonySDCPCoordinator
+from custom_components.sony_sdcp.hub import async_get_hub
+from custom_components.sony_sdcp.sdcp import SDCPError
+from custom_components.sony_sdcp.select import SonySDCPCalibrationPresetSelect
+from custom_components.sony_sdcp.switch import SonySDCPPictureMutingSwitch
+
+from .simulator import SimulatedProjector
+
+SCENARIOS = ("refresh", "select", "switch", "button")
+
+
+@dataclass(slots=True)
+class Result:
+    """Latency summary of one scenario."""
+
+    scenario: str
+    iterations: int
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+    failed: int
+    commands: int
+    commands_per_second: float
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of sorted samples."""
+    return samples[min(len(samples) - 1, max(0, round(fraction * len(samples)) - 1))]
+
+
+async def _async_measure(
+    name: str,
+    projector: SimulatedProjector,
+    iterations: int,
+    step: Callable[[int], Awaitable[float | None]],
+) -> Result:
+    """Time iterations of step.
+
+    step returns its own latency when the end of the operation is not the
+    moment it returns, e.g. for fire and forget IR presses. Failed
+    iterations are counted but left out of the latency figures.
+    """
+    frames = len(projector.stats.frames)
+    samples = []
+    failed = 0
+    started = time.perf_counter()
+    for i in range(iterations):
+        begin = time.perf_counter()
+        try:
+            latency = await step(i)
+        except (HomeAssistantError, SDCPError):
+            failed += 1
+            continue
+        samples.append(time.perf_counter() - begin if latency is None else latency)
+    elapsed = time.perf_counter() - started
+    commands = len(projector.stats.frames) - frames
+    samples = sorted(samples) or [float("nan")]
+    return Result(
+        scenario=name,
+        iterations=iterations,
+        p50_ms=_percentile(samples, 0.5) * 1000,
+        p99_ms=_percentile(samples, 0.99) * 1000,
+        mean_ms=sum(samples) / len(samples) * 1000,
+        failed=failed,
+        commands=commands,
+        commands_per_second=commands / elapsed if elapsed else 0.0,
+    )
+
+
+async def _async_run(args: argparse.Namespace) -> list[Result]:
+    """Run every scenario against a fresh simulator."""
+    projector = SimulatedProjector(
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        max_connections=args.max_connections,
+        seed=0,
+    )
+    port = await projector.async_start()
+
+    hass = HomeAssistant(tempfile.mkdtemp())
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Benchmark",
+        data={
+            CONF_HOST: "127.0.0.1",
+            CONF_PORT: port,
+            CONF_NAME: "Benchmark",
+            # Already probed, as on every start after the first
+            CONF_CAPABILITIES: {"model": None, "unsupported": []},
+        },
+        source="user",
+    )
+    hub = async_get_hub(hass)
+    coordinator = SonySDCPCoordinator(hass, entry, hub)
+    hub.async_add(entry.entry_id, coordinator)
+    await coordinator.async_refresh()
+
+    preset = SonySDCPCalibrationPresetSelect(coordinator, entry)
+    muting = SonySDCPPictureMutingSwitch(coordinator, entry)
+    menu = SonySDCPIRButton(coordinator, entry, "Menu", "MENU")
+
+    async def refresh(_: int) -> None:
+        await coordinator.async_refresh()
+
+    async def select(i: int) -> None:
+        await preset.async_select_option(CALIBRATION_PRESETS[i % 2])
+
+    async def switch(i: int) -> None:
+        await (muting.async_turn_on() if i % 2 == 0 else muting.async_turn_off())
+
+    async def button(_: int) -> float:
+        ir_frames = projector.stats.ir_frames
+        begin = time.perf_counter()
+        await menu.async_press()
+        while projector.stats.ir_frames == ir_frames:
+            await asyncio.sleep(0.001)
+        return time.perf_counter() - begin
+
+    scenarios = {"refresh": refresh, "select": select, "switch": switch, "button": button}
+    results = []
+    try:
+        for name in args.scenarios or SCENARIOS:
+            results.append(
+                await _async_measure(name, projector, args.iterations, scenarios[name])
+            )
+    finally:
+        await coordinator.async_shutdown()
+        hub.async_remove(entry.entry_id)
+        await projector.async_stop()
+        await hass.async_stop(force=True)
+    return results
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)}")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.01, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="0..1")
+    parser.add_argument("--max-connections", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+    if unknown := set(args.scenarios) - set(SCENARIOS):
+        parser.error(f"unknown scenario: {', '.join(sorted(unknown))}")
+
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(_async_run(args))
+
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+        return
+    print(
+        f"{'scenario':<10}{'n':>6}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}"
+        f"{'failed':>8}{'cmds':>7}{'cmd/s':>9}"
+    )
+    for r in results:
+        print(
+            f"{r.scenario:<10}{r.iterations:>6}{r.p50_ms:>10.2f}{r.p99_ms:>10.2f}"
+            f"{r.mean_ms:>10.2f}{r.failed:>8}{r.commands:>7}{r.commands_per_second:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
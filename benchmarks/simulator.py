@@ -0,0 +1,321 @@
+"""Simulated Sony projector speaking SDCP over TCP and SDAP over UDP.
+
+Run standalone to point a Home Assistant instance at it:
+
+    python -m benchmarks.simulator --port 53484 --latency 0.03
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import random
+import socket
+from struct import pack
+import time
+
+from pysdcp_extended.protocol import (
+    ACTIONS,
+    CALIBRATION_PRESETS,
+    COMMANDS,
+    INPUTS,
+    POWER_STATUS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_HEADER_LEN = 10
+_IR_CATEGORIES = (0x17, 0x19, 0x1B)
+
+# Response error codes, see RESPONSE_ERRORS in pysdcp_extended.protocol
+ERROR_INVALID_ITEM = 0x101
+ERROR_NOT_APPLICABLE = 0x180
+ERROR_DIFFERENT_COMMUNITY = 0x201
+
+# Readable items and their value right after power-up
+DEFAULT_VALUES: dict[int, int] = {
+    COMMANDS["INPUT"]: INPUTS["HDMI1"],
+    COMMANDS["CALIBRATION_PRESET"]: CALIBRATION_PRESETS["REF"],
+    COMMANDS["ASPECT_RATIO"]: 0,
+    COMMANDS["PICTURE_POSITION"]: 0,
+    COMMANDS["HDMI1_DYNAMIC_RANGE"]: 0,
+    COMMANDS["HDMI2_DYNAMIC_RANGE"]: 0,
+    COMMANDS["LAMP_CONTROL"]: 0,
+    COMMANDS["ADVANCED_IRIS"]: 0,
+    COMMANDS["MOTIONFLOW"]: 0,
+    COMMANDS["HDR"]: 0,
+    COMMANDS["2D_3D_DISPLAY_SELECT"]: 0,
+    COMMANDS["3D_FORMAT"]: 0,
+    COMMANDS["MENU_POSITION"]: 0,
+    COMMANDS["INPUT_LAG_REDUCTION"]: 0,
+    COMMANDS["PICTURE_MUTING"]: 0,
+    COMMANDS["GET_STATUS_ERROR"]: 0,
+    COMMANDS["GET_STATUS_LAMP_TIMER"]: 1234,
+}
+
+# Items that only answer while the projector is on
+_POWERED_COMMANDS = {COMMANDS["INPUT"], COMMANDS["PICTURE_MUTING"]}
+
+
+@dataclass(slots=True)
+class SimulatorStats:
+    """Counters for everything the simulator received."""
+
+    connections: int = 0
+    rejected_connections: int = 0
+    requests: int = 0
+    ir_frames: int = 0
+    dropped: int = 0
+    errors: int = 0
+    # (monotonic time received, action, command) of every frame
+    frames: list[tuple[float, int, int]] = field(default_factory=list)
+
+
+class SimulatedProjector:
+    """An asyncio SDCP server behaving like a Sony projector.
+
+    Powering on goes through START_UP for warm_up seconds and powering off
+    through COOLING for cool_down seconds. Every answer is delayed by
+    latency plus up to jitter seconds, a drop_rate share of requests get
+    the connection closed instead of an answer, and connections beyond
+    max_connections are closed right away, like the real hardware does.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        max_connections: int = 1,
+        warm_up: float = 2.0,
+        cool_down: float = 2.0,
+        powered_on: bool = True,
+        community: str = "SONY",
+        product_name: str = "VPL-VW285",
+        serial_number: int = 1234567,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the simulator."""
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.max_connections = max_connections
+        self.warm_up = warm_up
+        self.cool_down = cool_down
+        self.community = community
+        self.product_name = product_name
+        self.serial_number = serial_number
+        self.values = dict(DEFAULT_VALUES)
+        self.power_status = POWER_STATUS["POWER_ON" if powered_on else "STANDBY"]
+        self.stats = SimulatorStats()
+        self._random = random.Random(seed)
+        self._transition: asyncio.TimerHandle | None = None
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._advertiser: asyncio.Task | None = None
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the projector is on or warming up."""
+        return self.power_status in (
+            POWER_STATUS["START_UP"],
+            POWER_STATUS["START_UP_LAMP"],
+            POWER_STATUS["POWER_ON"],
+        )
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving SDCP and return the bound port."""
+        self._server = await asyncio.start_server(self._async_handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def async_stop(self) -> None:
+        """Close the server and every open connection."""
+        if self._advertiser is not None:
+            self._advertiser.cancel()
+            self._advertiser = None
+        if self._transition is not None:
+            self._transition.cancel()
+            self._transition = None
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def set_power(self, on: bool) -> None:
+        """Start a power transition, as the SET_POWER command does."""
+        if on == self.is_on:
+            return
+        if self._transition is not None:
+            self._transition.cancel()
+        if on:
+            self.power_status = POWER_STATUS["START_UP"]
+            settled, delay = POWER_STATUS["POWER_ON"], self.warm_up
+        else:
+            self.power_status = POWER_STATUS["COOLING"]
+            settled, delay = POWER_STATUS["STANDBY"], self.cool_down
+        self._transition = asyncio.get_running_loop().call_later(
+            delay, self._settle, settled
+        )
+
+    def _settle(self, power_status: int) -> None:
+        """Finish a power transition."""
+        self._transition = None
+        self.power_status = power_status
+
+    def _answer(self, action: int, command: int, data: bytes) -> tuple[bool, bytes]:
+        """Run a request, returning the success flag and response data."""
+        if command == COMMANDS["SET_POWER"] and action == ACTIONS["SET"]:
+            self.set_power(int.from_bytes(data, "big") != 0)
+            return True, b""
+        if command == COMMANDS["GET_STATUS_POWER"]:
+            if action != ACTIONS["GET"]:
+                return False, pack(">H", ERROR_NOT_APPLICABLE)
+            return True, pack(">H", self.power_status)
+        if command not in self.values:
+            return False, pack(">H", ERROR_INVALID_ITEM)
+        if not self.is_on and (
+            action == ACTIONS["SET"] or command in _POWERED_COMMANDS
+        ):
+            return False, pack(">H", ERROR_NOT_APPLICABLE)
+        if action == ACTIONS["SET"]:
+            self.values[command] = int.from_bytes(data, "big")
+            return True, b""
+        return True, pack(">H", self.values[command])
+
+    async def _async_handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client connection."""
+        if len(self._writers) >= self.max_connections:
+            self.stats.rejected_connections += 1
+            writer.close()
+            return
+        self.stats.connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(_HEADER_LEN)
+                    data = await reader.readexactly(header[9])
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                community = header[2:6]
+                action = header[6]
+                command = int.from_bytes(header[7:9], "big")
+                self.stats.frames.append((time.monotonic(), action, command))
+
+                if command >> 8 in _IR_CATEGORIES:
+                    # IR commands are fire and forget
+                    self.stats.ir_frames += 1
+                    continue
+
+                self.stats.requests += 1
+                if self.drop_rate and self._random.random() < self.drop_rate:
+                    self.stats.dropped += 1
+                    return
+
+                if community != self.community.encode("ascii"):
+                    success, payload = False, pack(">H", ERROR_DIFFERENT_COMMUNITY)
+                else:
+                    success, payload = self._answer(action, command, data)
+                if not success:
+                    self.stats.errors += 1
+
+                if delay := self.latency + self._random.uniform(0, self.jitter):
+                    await asyncio.sleep(delay)
+                writer.write(
+                    header[:6]
+                    + bytes([int(success)])
+                    + header[7:9]
+                    + bytes([len(payload)])
+                    + payload
+                )
+                await writer.drain()
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def advertisement(self) -> bytes:
+        """Build the SDAP advertisement packet for the current state."""
+        return (
+            b"DA"
+            + bytes([2, 10])
+            + self.community.encode("ascii")[:4].ljust(4, b"\x00")
+            + self.product_name.encode("ascii")[:12].ljust(12, b"\x00")
+            + pack(">IH", self.serial_number, self.power_status)
+            + b"Simulator".ljust(24, b"\x00")
+        )
+
+    def start_advertising(
+        self, target: tuple[str, int], interval: float = 30.0
+    ) -> None:
+        """Send an SDAP advertisement to target every interval seconds."""
+        self._advertiser = asyncio.get_running_loop().create_task(
+            self._async_advertise(target, interval)
+        )
+
+    async def _async_advertise(self, target: tuple[str, int], interval: float) -> None:
+        """Keep advertising until stopped."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        sock.setblocking(False)
+        try:
+            while True:
+                sock.sendto(self.advertisement(), target)
+                await asyncio.sleep(interval)
+        finally:
+            sock.close()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Serve until interrupted."""
+    projector = SimulatedProjector(
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        max_connections=args.max_connections,
+        warm_up=args.warm_up,
+        cool_down=args.cool_down,
+        powered_on=not args.standby,
+    )
+    port = await projector.async_start(args.host, args.port)
+    if args.sdap_target:
+        projector.start_advertising((args.sdap_target, args.sdap_port), args.sdap_interval)
+    _LOGGER.info("Simulated projector listening on %s:%s", args.host, port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await projector.async_stop()
+
+
+def main() -> None:
+    """Run the simulator from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=53484)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="0..1")
+    parser.add_argument("--max-connections", type=int, default=1)
+    parser.add_argument("--warm-up", type=float, default=2.0, help="seconds")
+    parser.add_argument("--cool-down", type=float, default=2.0, help="seconds")
+    parser.add_argument("--standby", action="store_true", help="start powered off")
+    parser.add_argument("--sdap-target", help="address to send SDAP advertisements to")
+    parser.add_argument("--sdap-port", type=int, default=53862)
+    parser.add_argument("--sdap-interval", type=float, default=30.0, help="seconds")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
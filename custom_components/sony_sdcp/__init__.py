@@ -4,32 +4,87 @@ from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import CONF_SDAP_LISTENER, DEFAULT_SDAP_LISTENER, DOMAIN
 from .coordinator import SonySDCPCoordinator
+from .hub import DATA_HUB, async_get_hub
+from .services import async_setup_services
+from .store import SonySDCPStore
 
-PLATFORMS: list[Platform] = [Platform.SWITCH, Platform.SELECT, Platform.SENSOR, Platform.BUTTON]
+PLATFORMS: list[Platform] = [
+    Platform.SWITCH,
+    Platform.SELECT,
+    Platform.SENSOR,
+    Platform.BUTTON,
+    Platform.REMOTE,
+]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Sony SDCP services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Sony SDCP from a config entry."""
-    coordinator = SonySDCPCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    hub = async_get_hub(hass)
+    coordinator = SonySDCPCoordinator(hass, entry, hub)
+    hub.async_add(entry.entry_id, coordinator)
+    # Don't hold up startup on the projector: entities start from the state
+    # of the previous run and the first refresh runs in the background
+    await coordinator.async_restore()
+    if entry.options.get(CONF_SDAP_LISTENER, DEFAULT_SDAP_LISTENER):
+        await coordinator.async_start_sdap()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {entry.title}"
+    )
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    coordinator: SonySDCPCoordinator = hass.data[DOMAIN][entry.entry_id]
+    # Entry data is also updated by the coordinator itself
+    if entry.options != coordinator.options:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: SonySDCPCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        _async_remove_from_hub(hass, entry)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored state of a removed config entry."""
+    await SonySDCPStore(hass, entry.entry_id).async_remove()
+
+
+@callback
+def _async_remove_from_hub(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop a projector from the hub, and the hub once it is empty."""
+    hub = async_get_hub(hass)
+    hub.async_remove(entry.entry_id)
+    if not hub.coordinators:
+        hass.data.pop(DATA_HUB)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pysdcp_extended.protocol import ACTIONS, COMMANDS_IR
+from pysdcp_extended.protocol import COMMANDS_IR
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
@@ -58,7 +58,8 @@ class SonySDCPIRButton(CoordinatorEntity[SonySDCPCoordinator], ButtonEntity):
         display_name: str,
         command_key: str,
     ) -> None:
-        super().__init__(coordinator)
+        # Only affected by availability
+        super().__init__(coordinator, context=0)
         self._attr_name = display_name
         self._attr_unique_id = f"{entry.entry_id}_{command_key.lower()}"
         self._attr_icon = _IR_ICONS.get(command_key, "mdi:remote")
@@ -70,9 +71,5 @@ class SonySDCPIRButton(CoordinatorEntity[SonySDCPCoordinator], ButtonEntity):
         self._command_key = command_key
 
     async def async_press(self) -> None:
-        """Send the IR command."""
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS_IR[self._command_key],
-        )
+        """Queue the IR command."""
+        self.coordinator.ir_queue.async_press(COMMANDS_IR[self._command_key])
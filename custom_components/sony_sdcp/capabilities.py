@@ -0,0 +1,87 @@
+"""Items supported by a projector model."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+
+from .sdcp import SDCPDataError, SDCPError, SDCPResponseError
+
+# "Item Error: Invalid Item": the model has no such item. Other item errors,
+# such as "Not Applicable Item", depend on the current mode.
+_UNSUPPORTED_ERRORS = (0x0101,)
+
+
+@dataclass(frozen=True, slots=True)
+class Capabilities:
+    """Model name and the items a projector does not support."""
+
+    model: str | None = None
+    unsupported: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_errors(
+        cls, model: str | None, errors: Mapping[str, SDCPError]
+    ) -> Capabilities | None:
+        """Return the capabilities shown by a probe's errors.
+
+        Returns None if any item could not be probed, as its support is
+        then unknown. Items that answered with unexpected data exist.
+        """
+        if not all(
+            isinstance(err, (SDCPResponseError, SDCPDataError)) for err in errors.values()
+        ):
+            return None
+        return cls(
+            model,
+            frozenset(
+                item
+                for item, err in errors.items()
+                if isinstance(err, SDCPResponseError) and err.code in _UNSUPPORTED_ERRORS
+            ),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Capabilities:
+        """Return capabilities stored in a config entry."""
+        return cls(data.get("model"), frozenset(data.get("unsupported", ())))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the capabilities to store in a config entry."""
+        return {"model": self.model, "unsupported": sorted(self.unsupported)}
+
+    def supports(self, item: str) -> bool:
+        """Return True unless the item is known to be unsupported."""
+        return item not in self.unsupported
+
+
+@callback
+def async_supported_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    platform: Platform,
+    capabilities: Capabilities | None,
+    entities: Iterable[tuple[str, Entity]],
+) -> list[Entity]:
+    """Return the entities of supported items, given as (item, entity).
+
+    Entities of unsupported items created before the projector was probed
+    are removed from the entity registry.
+    """
+    supported = []
+    registry = er.async_get(hass)
+    for item, entity in entities:
+        if capabilities is None or capabilities.supports(item):
+            supported.append(entity)
+        elif entity_id := registry.async_get_entity_id(
+            platform, entry.domain, entity.unique_id
+        ):
+            registry.async_remove(entity_id)
+    return supported
@@ -0,0 +1,96 @@
+"""Circuit breaker for unreachable projectors."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+import time
+
+from .const import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RETRY_MAX, CIRCUIT_RETRY_MIN
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop contacting a projector that keeps failing.
+
+    After failure_threshold failures in a row the circuit opens and commands
+    are refused without any I/O. Once the retry delay has passed a single
+    command is let through as a probe: if it succeeds the circuit closes,
+    otherwise it opens again with the delay doubled, up to max_delay.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        min_delay: float = CIRCUIT_RETRY_MIN,
+        max_delay: float = CIRCUIT_RETRY_MAX,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self._delay = 0.0
+        self._retry_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state."""
+        if self.failures < self.failure_threshold:
+            return CircuitState.CLOSED
+        if self._probing or self.retry_in == 0:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe is allowed."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+    @property
+    def blocked(self) -> bool:
+        """Return True if a command would be refused right now."""
+        return self.failures >= self.failure_threshold and (
+            self._probing or self.retry_in > 0
+        )
+
+    def allow(self) -> bool:
+        """Return True if a command may be sent, claiming the probe if needed."""
+        if self.failures < self.failure_threshold:
+            return True
+        if self.blocked:
+            self.rejected += 1
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after the projector answered."""
+        self.failures = 0
+        self._delay = 0.0
+        self._retry_at = 0.0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit once past the threshold."""
+        self.failures += 1
+        self._probing = False
+        if self.failures < self.failure_threshold:
+            return
+        if self.failures == self.failure_threshold:
+            self.trips += 1
+        self._delay = min(max(self._delay * 2, self.min_delay), self.max_delay)
+        self._retry_at = time.monotonic() + self._delay
+
+    def record_aborted(self) -> None:
+        """Release the probe of a command cancelled before it finished."""
+        self._probing = False
@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
-import pysdcp_extended
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.core import callback
 
-from .const import DOMAIN
+from .const import (
+    CONF_FAST_POLL_INTERVAL,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MODEL,
+    CONF_POLL_INTERVAL,
+    CONF_SDAP_LISTENER,
+    DEFAULT_FAST_POLL_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_SDAP_LISTENER,
+    DOMAIN,
+)
+from .discovery import DiscoveredProjector, async_discover
+from .sdcp import SDCPClient, SDCPError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,32 +41,149 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Choice in the device picker that leads to the manual form
+MANUAL_ENTRY = "manual"
+
 
 class SonySDCPConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Sony SDCP."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> SonySDCPOptionsFlow:
+        """Get the options flow for this handler."""
+        return SonySDCPOptionsFlow()
+
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovery_task: asyncio.Task[list[DiscoveredProjector]] | None = None
+        self._discovered: dict[str, DiscoveredProjector] = {}
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
-        """Handle the initial step."""
+        """Look for projectors on the network."""
+        if self._discovery_task is None:
+            self._discovery_task = self.hass.async_create_task(
+                async_discover(self.hass)
+            )
+        if not self._discovery_task.done():
+            return self.async_show_progress(
+                progress_action="discovery", progress_task=self._discovery_task
+            )
+
+        configured = {
+            entry.data[CONF_HOST]
+            for entry in self._async_current_entries(include_ignore=False)
+        }
+        self._discovered = {
+            projector.host: projector
+            for projector in self._discovery_task.result()
+            if projector.host not in configured
+        }
+        if not self._discovered:
+            return self.async_show_progress_done(next_step_id="manual")
+        return self.async_show_progress_done(next_step_id="pick_device")
+
+    async def async_step_pick_device(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Let the user pick a discovered projector."""
+        if user_input is not None:
+            if (host := user_input[CONF_HOST]) == MANUAL_ENTRY:
+                return await self.async_step_manual()
+            self._async_abort_entries_match({CONF_HOST: host})
+            projector = self._discovered[host]
+            name = projector.model or "Sony projector"
+            data = {CONF_HOST: host, CONF_NAME: name}
+            if projector.model:
+                data[CONF_MODEL] = projector.model
+            return self.async_create_entry(title=name, data=data)
+
+        choices = {
+            host: projector.label for host, projector in self._discovered.items()
+        }
+        choices[MANUAL_ENTRY] = "Enter the IP address manually"
+        return self.async_show_form(
+            step_id="pick_device",
+            data_schema=vol.Schema({vol.Required(CONF_HOST): vol.In(choices)}),
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle a projector entered by hand."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            self._async_abort_entries_match({CONF_HOST: user_input[CONF_HOST]})
+            client = SDCPClient(user_input[CONF_HOST])
             try:
-                projector = pysdcp_extended.Projector(user_input[CONF_HOST])
-                await self.hass.async_add_executor_job(projector.get_power)
-            except Exception:
+                await client.async_get_power()
+            except SDCPError:
                 errors["base"] = "cannot_connect"
             else:
                 return self.async_create_entry(
                     title=user_input[CONF_NAME],
                     data=user_input,
                 )
+            finally:
+                await client.async_close()
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+
+class SonySDCPOptionsFlow(OptionsFlow):
+    """Handle polling options for Sony SDCP."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if not (
+                user_input[CONF_FAST_POLL_INTERVAL]
+                <= user_input[CONF_POLL_INTERVAL]
+                <= user_input[CONF_MAX_POLL_INTERVAL]
+            ):
+                errors["base"] = "invalid_intervals"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_POLL_INTERVAL,
+                        default=options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Required(
+                        CONF_FAST_POLL_INTERVAL,
+                        default=options.get(
+                            CONF_FAST_POLL_INTERVAL, DEFAULT_FAST_POLL_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                    vol.Required(
+                        CONF_MAX_POLL_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=86400)),
+                    vol.Required(
+                        CONF_SDAP_LISTENER,
+                        default=options.get(CONF_SDAP_LISTENER, DEFAULT_SDAP_LISTENER),
+                    ): bool,
+                }
+            ),
+            errors=errors,
+        )
@@ -9,6 +9,115 @@ DOMAIN = "sony_sdcp"
 CONF_POLL_INTERVAL = "poll_interval"
 DEFAULT_POLL_INTERVAL = 30
 
+# Used during warm-up/cool-down and right after a command was sent
+CONF_FAST_POLL_INTERVAL = "fast_poll_interval"
+DEFAULT_FAST_POLL_INTERVAL = 3
+
+# Upper bound for the standby backoff
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+DEFAULT_MAX_POLL_INTERVAL = 300
+
+# How long polling stays fast after a command
+COMMAND_BOOST_DURATION = 15
+
+# Delays before each read-back of a written item, in seconds
+VERIFY_DELAYS = (0.5, 1, 2, 4, 8)
+
+# Polls across all projectors: first-poll spacing in seconds, relative
+# interval jitter and how many may run at once
+POLL_STAGGER = 2
+POLL_JITTER = 0.1
+MAX_CONCURRENT_POLLS = 2
+
+# Commands sent while the projector warms up or cools down are held for up
+# to DEFER_TIMEOUT seconds
+DEFER_TIMEOUT = 120
+
+# Settings are read back a few per poll, each at most once per TTL
+SETTINGS_PER_POLL = 2
+SETTING_TTL = 300
+
+# Last known state is written to disk at most this often, in seconds
+STORAGE_VERSION = 2
+STORAGE_SAVE_DELAY = 10
+
+CONF_SDAP_LISTENER = "sdap_listener"
+DEFAULT_SDAP_LISTENER = True
+
+# Entry data: model name, and the items found at the first probe
+CONF_MODEL = "model"
+CONF_CAPABILITIES = "capabilities"
+
+# --- SDCP / PJ Talk transport ---
+
+SDCP_PORT = 53484
+SDAP_PORT = 53862
+SDCP_COMMUNITY = "SONY"
+DEFAULT_TIMEOUT = 2
+
+# Circuit breaker: failures in a row before a projector is treated as
+# unreachable, and the bounds of the delay between probes in seconds
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_RETRY_MIN = 5
+CIRCUIT_RETRY_MAX = 300
+
+# Minimum gap between two commands sent to the projector, in seconds
+COMMAND_MIN_INTERVAL = 0.05
+
+# Advertisements are sent every 30 s by default; allow one to be missed
+SDAP_MAX_AGE = 65
+
+# Latency samples kept per command, and histogram bucket bounds in seconds
+METRICS_WINDOW = 200
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0)
+
+# --- Discovery ---
+
+# Overall time to look for projectors, in seconds
+DISCOVERY_TIMEOUT = 5
+# Per-address SDCP probe timeout, in seconds
+DISCOVERY_PROBE_TIMEOUT = 1
+# Addresses probed at once
+DISCOVERY_CONCURRENCY = 64
+# Larger local networks are only probed around our own address
+DISCOVERY_MAX_PREFIX = 24
+
+# --- IR command queue ---
+
+# Gap between IR frames sent to the projector, in seconds
+IR_COMMAND_INTERVAL = 0.15
+# Presses of one key merged into a single run
+IR_MAX_REPEATS = 20
+# Runs of different keys waiting to be sent
+IR_MAX_PENDING = 10
+# Frames of one remote command stream, including held keys
+IR_MAX_STREAM_FRAMES = 200
+
+# --- Macros ---
+
+# Steps in one macro, counting each repeat of a key
+MACRO_MAX_STEPS = 100
+# Seconds of delay steps in one macro, in total
+MACRO_MAX_DELAY = 60
+# Seconds to wait after an IR key and after a setting, by model name prefix.
+# Settings are acknowledged once applied; IR keys are not, and menus need
+# time to redraw before the next key registers.
+MACRO_TIMING_PROFILES = {
+    "VPL-VW": (0.25, 0.0),
+    "VPL-HW": (0.3, 0.0),
+}
+MACRO_DEFAULT_TIMING = (0.3, 0.0)
+# Bounds of the calibrated delay after an IR key, in seconds
+MACRO_IR_DELAY_MIN = 0.15
+MACRO_IR_DELAY_MAX = 1.0
+# Pauses of a command sequence longer than this release the connection, so
+# polls and other commands can run meanwhile
+SEQUENCE_MAX_HOLD = MACRO_IR_DELAY_MAX
+# Measured IR key handling time is multiplied by this margin
+MACRO_CALIBRATION_MARGIN = 1.5
+# Weight of a new measurement in the calibrated delay
+MACRO_CALIBRATION_WEIGHT = 0.25
+
 # --- Display lists (shown in HA UI) ---
 
 HDMI_INPUTS = ["HDMI 1", "HDMI 2"]
@@ -41,8 +150,8 @@ MENU_POSITIONS = ["Bottom Left", "Center"]
 # --- Mappings: HA display name -> pysdcp_extended protocol value ---
 
 HDMI_INPUT_MAP = {
-    "HDMI 1": 1,
-    "HDMI 2": 2,
+    "HDMI 1": "HDMI1",
+    "HDMI 2": "HDMI2",
 }
 
 ASPECT_RATIO_MAP = {
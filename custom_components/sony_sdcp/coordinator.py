@@ -2,66 +2,953 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import timedelta
+import functools
 import logging
+import operator
+import time
+from typing import Any
 
-import pysdcp_extended
+from pysdcp_extended.protocol import (
+    ACTIONS,
+    ADVANCED_IRIS as PROTO_ADVANCED_IRIS,
+    ASPECT_RATIOS as PROTO_ASPECT_RATIOS,
+    CALIBRATION_PRESETS as PROTO_CALIBRATION_PRESETS,
+    COMMANDS,
+    COMMANDS_IR,
+    DYNAMIC_RANGES as PROTO_DYNAMIC_RANGES,
+    HDR as PROTO_HDR,
+    INPUTS as PROTO_INPUTS,
+    INPUT_LAG_REDUCTION as PROTO_INPUT_LAG_REDUCTION,
+    LAMP_CONTROL as PROTO_LAMP_CONTROL,
+    MENU_POSITIONS as PROTO_MENU_POSITIONS,
+    MOTIONFLOW as PROTO_MOTIONFLOW,
+    PICTURE_MUTING as PROTO_PICTURE_MUTING,
+    PICTURE_POSITIONS as PROTO_PICTURE_POSITIONS,
+    POWER_STATUS,
+    THREE_D_FORMATS as PROTO_3D_FORMATS,
+    TWO_D_THREE_D_SELECT as PROTO_2D_3D,
+)
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEFAULT_POLL_INTERVAL, DOMAIN
+from .const import (
+    ADVANCED_IRIS_MAP,
+    ASPECT_RATIO_MAP,
+    CALIBRATION_PRESET_MAP,
+    COMMAND_BOOST_DURATION,
+    CONF_CAPABILITIES,
+    CONF_FAST_POLL_INTERVAL,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MODEL,
+    CONF_POLL_INTERVAL,
+    DEFAULT_FAST_POLL_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POLL_INTERVAL,
+    DOMAIN,
+    DYNAMIC_RANGE_MAP,
+    HDMI_INPUT_MAP,
+    HDR_MAP,
+    LAMP_CONTROL_MAP,
+    MENU_POSITION_MAP,
+    MOTIONFLOW_MAP,
+    PICTURE_POSITION_MAP,
+    SDAP_MAX_AGE,
+    SDCP_PORT,
+    SETTING_TTL,
+    SETTINGS_PER_POLL,
+    THREE_D_FORMAT_MAP,
+    TWO_D_THREE_D_MAP,
+    VERIFY_DELAYS,
+)
+from .capabilities import Capabilities
+from .circuit import CircuitState
+from .deferral import DeferredCommand, DeferredCommandQueue
+from .hub import SonySDCPHub
+from .ir import IRCommandQueue
+from .macro import Macro, TimingProfile
+from .scheduler import Priority
+from .sdap import SDAPAdvertisement, async_subscribe as async_subscribe_sdap
+from .state import ProjectorState
+from .store import SonySDCPStore, StoredState
+from .sdcp import (
+    SDCPClient,
+    SDCPDataError,
+    SDCPError,
+    decode_input,
+    decode_lamp_hours,
+    decode_muting,
+    decode_power,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class SonySDCPCoordinator(DataUpdateCoordinator[dict]):
+def _option_values(
+    display_map: dict[str, str], proto_values: dict[str, int]
+) -> dict[str, int]:
+    """Map display options to protocol values."""
+    return {option: proto_values[key] for option, key in display_map.items()}
+
+
+# Settings only changed by the user: data key -> (SDCP command, value -> protocol value)
+SETTINGS: dict[str, tuple[int, dict[Any, int]]] = {
+    "aspect_ratio": (
+        COMMANDS["ASPECT_RATIO"],
+        _option_values(ASPECT_RATIO_MAP, PROTO_ASPECT_RATIOS),
+    ),
+    "picture_position": (
+        COMMANDS["PICTURE_POSITION"],
+        _option_values(PICTURE_POSITION_MAP, PROTO_PICTURE_POSITIONS),
+    ),
+    "calibration_preset": (
+        COMMANDS["CALIBRATION_PRESET"],
+        _option_values(CALIBRATION_PRESET_MAP, PROTO_CALIBRATION_PRESETS),
+    ),
+    "hdmi1_dynamic_range": (
+        COMMANDS["HDMI1_DYNAMIC_RANGE"],
+        _option_values(DYNAMIC_RANGE_MAP, PROTO_DYNAMIC_RANGES),
+    ),
+    "hdmi2_dynamic_range": (
+        COMMANDS["HDMI2_DYNAMIC_RANGE"],
+        _option_values(DYNAMIC_RANGE_MAP, PROTO_DYNAMIC_RANGES),
+    ),
+    "lamp_control": (
+        COMMANDS["LAMP_CONTROL"],
+        _option_values(LAMP_CONTROL_MAP, PROTO_LAMP_CONTROL),
+    ),
+    "advanced_iris": (
+        COMMANDS["ADVANCED_IRIS"],
+        _option_values(ADVANCED_IRIS_MAP, PROTO_ADVANCED_IRIS),
+    ),
+    "motionflow": (
+        COMMANDS["MOTIONFLOW"],
+        _option_values(MOTIONFLOW_MAP, PROTO_MOTIONFLOW),
+    ),
+    "hdr": (
+        COMMANDS["HDR"],
+        _option_values(HDR_MAP, PROTO_HDR),
+    ),
+    "2d_3d_display": (
+        COMMANDS["2D_3D_DISPLAY_SELECT"],
+        _option_values(TWO_D_THREE_D_MAP, PROTO_2D_3D),
+    ),
+    "3d_format": (
+        COMMANDS["3D_FORMAT"],
+        _option_values(THREE_D_FORMAT_MAP, PROTO_3D_FORMATS),
+    ),
+    "menu_position": (
+        COMMANDS["MENU_POSITION"],
+        _option_values(MENU_POSITION_MAP, PROTO_MENU_POSITIONS),
+    ),
+    "input_lag_reduction": (
+        COMMANDS["INPUT_LAG_REDUCTION"],
+        {True: PROTO_INPUT_LAG_REDUCTION["ON"], False: PROTO_INPUT_LAG_REDUCTION["OFF"]},
+    ),
+}
+
+# Settings read back from the projector: data key -> (SDCP command, response decoder)
+SETTING_ITEMS: dict[str, tuple[int, Callable[[int | None], Any]]] = {
+    item: (command, {data: value for value, data in values.items()}.get)
+    for item, (command, values) in SETTINGS.items()
+}
+
+# Settings a profile can apply, in the order they are sent. Picture settings
+# are stored per calibration preset, so the input, 3D mode and preset are
+# switched before anything else.
+PROFILE_SETTINGS: dict[str, tuple[int, dict[Any, int]]] = {
+    "input": (COMMANDS["INPUT"], _option_values(HDMI_INPUT_MAP, PROTO_INPUTS)),
+    "2d_3d_display": SETTINGS["2d_3d_display"],
+    "3d_format": SETTINGS["3d_format"],
+    "calibration_preset": SETTINGS["calibration_preset"],
+    **SETTINGS,
+}
+# Settings that switch to another set of stored picture settings
+PRESET_SWITCHES = frozenset({"input", "2d_3d_display", "calibration_preset"})
+# Settings that may change with each of them: the ones after it in a profile
+_PROFILE_ORDER = list(PROFILE_SETTINGS)
+PRESET_DEPENDENT: dict[str, tuple[str, ...]] = {
+    item: tuple(_PROFILE_ORDER[_PROFILE_ORDER.index(item) + 1 :]) for item in PRESET_SWITCHES
+}
+
+# Queryable items: data key -> (SDCP command, response decoder)
+QUERY_ITEMS: dict[str, tuple[int, Callable[[int | None], Any]]] = {
+    "power_status": (COMMANDS["GET_STATUS_POWER"], int),
+    "muting": (COMMANDS["PICTURE_MUTING"], decode_muting),
+    "lamp_hours": (COMMANDS["GET_STATUS_LAMP_TIMER"], decode_lamp_hours),
+    "input": (COMMANDS["INPUT"], decode_input),
+    **SETTING_ITEMS,
+}
+
+# Every request the integration sends, so the client can build their
+# frames once at setup
+REQUESTS: tuple[tuple[int, int, int | None], ...] = (
+    *((ACTIONS["GET"], command, None) for command, _ in QUERY_ITEMS.values()),
+    *(
+        (ACTIONS["SET"], command, value)
+        for command, values in PROFILE_SETTINGS.values()
+        for value in values.values()
+    ),
+    *(
+        (ACTIONS["SET"], COMMANDS["PICTURE_MUTING"], value)
+        for value in PROTO_PICTURE_MUTING.values()
+    ),
+    (ACTIONS["SET"], COMMANDS["SET_POWER"], POWER_STATUS["START_UP"]),
+    (ACTIONS["SET"], COMMANDS["SET_POWER"], POWER_STATUS["STANDBY"]),
+    *((ACTIONS["SET"], command, None) for command in COMMANDS_IR.values()),
+)
+
+# Items only polled while the projector is on
+POWERED_ITEMS = ["muting", "lamp_hours", "input"]
+
+# Seconds a polled item stays fresh before it is read again
+ITEM_TTLS = {
+    "muting": 60,
+    "input": 60,
+    "lamp_hours": 3600,
+    **{item: SETTING_TTL for item in SETTING_ITEMS},
+}
+
+# Items whose cached value stays valid while the projector is in standby
+STANDBY_ITEMS = ["lamp_hours", *SETTING_ITEMS]
+
+# Poll ticks are not exact; treat items this close to expiry as expired
+_TTL_SLACK = 1.0
+
+# Warm-up and cool-down power states
+WARMING_STATES = (POWER_STATUS["START_UP"], POWER_STATUS["START_UP_LAMP"])
+COOLING_STATES = (POWER_STATUS["COOLING"], POWER_STATUS["COOLING2"])
+TRANSITION_STATES = (*WARMING_STATES, *COOLING_STATES)
+
+
+@dataclass
+class QueryResult:
+    """Outcome of a batched query, per item."""
+
+    values: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, SDCPError] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every item was read."""
+        return not self.errors
+
+
+class SonySDCPCoordinator(DataUpdateCoordinator[ProjectorState]):
     """Coordinator to poll projector state."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, hub: SonySDCPHub
+    ) -> None:
         """Initialize the coordinator."""
-        self.projector = pysdcp_extended.Projector(entry.data[CONF_HOST])
+        self.entry = entry
+        self.entry_id = entry.entry_id
+        self.hub = hub
+        self.client = SDCPClient(
+            entry.data[CONF_HOST],
+            entry.data.get(CONF_PORT, SDCP_PORT),
+            requests=REQUESTS,
+        )
+        self.ir_queue = IRCommandQueue(hass, self.client)
+        self.deferred = DeferredCommandQueue()
+        self._deferred_task: asyncio.Task | None = None
+        self._deferred_wake = asyncio.Event()
+        self.store = SonySDCPStore(hass, entry.entry_id)
+        self.advertisement: SDAPAdvertisement | None = None
+        self._advertised_at = 0.0
+        self._sdap_unsub: CALLBACK_TYPE | None = None
+        self._poll_interval = timedelta(
+            seconds=entry.options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
+        )
+        self._fast_poll_interval = timedelta(
+            seconds=entry.options.get(CONF_FAST_POLL_INTERVAL, DEFAULT_FAST_POLL_INTERVAL)
+        )
+        self._max_poll_interval = timedelta(
+            seconds=entry.options.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL)
+        )
+        self._boost_until = 0.0
+        # item -> (value, monotonic time it was read)
+        self._cache: dict[str, tuple[Any, float]] = {}
+        self._verify_tasks: dict[frozenset[str], asyncio.Task] = {}
+        # Supported items, None until the projector was probed
+        self.capabilities: Capabilities | None = None
+        self._powered_items = POWERED_ITEMS
+        self._setting_items = list(SETTING_ITEMS)
+        if (capabilities := entry.data.get(CONF_CAPABILITIES)) is not None:
+            self._set_capabilities(Capabilities.from_dict(capabilities))
+        # Options the entry was set up with
+        self.options = dict(entry.options)
+        # Macro timing calibrated on this projector, None until measured
+        self._macro_timing: TimingProfile | None = None
+        # Update success and data version the entities were last notified of
+        self._notified: tuple[bool, int] | None = None
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_POLL_INTERVAL),
+            update_interval=self._poll_interval,
         )
 
-    async def _async_update_data(self) -> dict:
-        """Fetch state from projector."""
+    def supports(self, item: str) -> bool:
+        """Return False if the projector is known not to support an item."""
+        return self.capabilities is None or self.capabilities.supports(item)
+
+    def _set_capabilities(self, capabilities: Capabilities) -> None:
+        """Stop polling the items the projector does not support."""
+        self.capabilities = capabilities
+        self._powered_items = [item for item in POWERED_ITEMS if self.supports(item)]
+        self._setting_items = [item for item in SETTING_ITEMS if self.supports(item)]
+
+    @property
+    def model(self) -> str | None:
+        """Return the projector model name, if known."""
+        if self.capabilities is not None and self.capabilities.model:
+            return self.capabilities.model
+        if self.advertisement is not None:
+            return self.advertisement.product_name
+        return self.entry.data.get(CONF_MODEL)
+
+    async def async_restore(self) -> None:
+        """Start from the state stored by the previous run, if any.
+
+        Restored items keep the age they had, so only those that expired
+        while Home Assistant was down are read again by the first polls.
+        """
+        if (stored := await self.store.async_load()) is None:
+            return
+        if stored.macro_timing is not None:
+            self._macro_timing = TimingProfile(*stored.macro_timing)
+        offset = time.monotonic() - time.time()
+        for item, (value, read_at) in stored.items.items():
+            if item in ITEM_TTLS:
+                self._cache[item] = (value, read_at + offset)
+        power_status = stored.power_status
+        self.data = ProjectorState().evolve(
+            {
+                "power_status": power_status,
+                "power": None if power_status is None else decode_power(power_status),
+                **self._cached_data(ITEM_TTLS),
+            }
+        )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the entities whose items changed and persist changed state.
+
+        Entities pass the item_mask of the data keys they show as their
+        coordinator context. They are only called back when one of those
+        items changed, or for every entity when the update success changed.
+        Entities without a context are always called back.
+        """
+        data = self.data
+        notified = self._notified
+        self._notified = (self.last_update_success, data.version if data else -1)
+        if notified is None or notified[0] != self.last_update_success or data is None:
+            changed = None
+        elif data.version == notified[1]:
+            changed = 0
+        elif data.version == notified[1] + 1:
+            changed = data.changed
+        else:
+            # Skipped a snapshot; the mask only covers the last step
+            changed = None
+
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or changed & context:
+                update_callback()
+
+        if self.deferred.pending:
+            # The power state may have changed
+            self._deferred_wake.set()
+
+        if data is not None and (notified is None or data.version != notified[1]):
+            # Polls that only move read times forward are not worth a write;
+            # those are saved with the next change or on shutdown
+            self.store.async_delay_save(self._stored_state)
+
+    @callback
+    def _stored_state(self) -> StoredState:
+        """Return the state to persist, with read times on the wall clock."""
+        offset = time.time() - time.monotonic()
+        return StoredState(
+            power_status=self.data.power_status,
+            items={
+                # Items marked for re-reading are stored as read at the epoch
+                item: (value, max(read_at + offset, 0.0))
+                for item, (value, read_at) in self._cache.items()
+            },
+            macro_timing=None
+            if self._macro_timing is None
+            else (self._macro_timing.ir_delay, self._macro_timing.set_delay),
+        )
+
+    async def async_start_sdap(self) -> None:
+        """Receive power state from the projector's SDAP advertisements."""
+        self._sdap_unsub = await async_subscribe_sdap(
+            self.hass, self.client.host, self._async_handle_advertisement
+        )
+
+    @callback
+    def _async_handle_advertisement(self, advertisement: SDAPAdvertisement) -> None:
+        """Push an advertised power change into coordinator data."""
+        self.advertisement = advertisement
+        self._advertised_at = time.monotonic()
+        if (
+            self.data is None
+            or self.data.power_status == advertisement.power_state
+        ):
+            return
+
+        _LOGGER.debug("Projector advertised power state %s", advertisement.power_state)
+        self._set_next_interval(advertisement.power_state)
+        if advertisement.is_on:
+            # Muting, lamp hours and input are only available over SDCP
+            self.async_set_updated_data(
+                self.data.evolve(
+                    {"power_status": advertisement.power_state, "power": True}
+                )
+            )
+            self.hass.async_create_task(self.async_request_refresh())
+        else:
+            self.async_set_updated_data(self._standby_data(advertisement.power_state))
+
+    def _advertised_standby(self) -> bool:
+        """Return True if a recent advertisement reports standby."""
+        return (
+            self.advertisement is not None
+            and not self.advertisement.is_on
+            and time.monotonic() - self._advertised_at < SDAP_MAX_AGE
+        )
+
+    def _next_update_interval(self, power_status: int | None) -> timedelta:
+        """Pick the next poll interval from the power state.
+
+        Polling is fast during warm-up/cool-down and right after a command,
+        runs at the configured interval while on, and doubles on each poll
+        in standby up to the configured maximum.
+        """
+        if (
+            power_status in TRANSITION_STATES
+            or time.monotonic() < self._boost_until
+        ):
+            return self._fast_poll_interval
+        if power_status == POWER_STATUS["STANDBY"]:
+            return min(
+                max(self.update_interval * 2, self._poll_interval),
+                self._max_poll_interval,
+            )
+        return self._poll_interval
+
+    def _set_next_interval(self, power_status: int | None) -> None:
+        """Schedule the next poll, spread out against the other projectors.
+
+        While the circuit breaker is open the next poll is the probe, so it
+        is scheduled for when the breaker lets it through.
+        """
+        circuit = self.client.circuit
+        if circuit.state is not CircuitState.CLOSED:
+            self.update_interval = max(
+                timedelta(seconds=circuit.retry_in), self._fast_poll_interval
+            )
+            return
+        # Capped after the jitter, so the maximum standby interval holds
+        self.update_interval = min(
+            self.hub.spread(self.entry_id, self._next_update_interval(power_status)),
+            self._max_poll_interval,
+        )
+
+    @callback
+    def _async_boost_polling(self) -> None:
+        """Poll fast for a while to pick up the effect of a command."""
+        self._boost_until = time.monotonic() + COMMAND_BOOST_DURATION
+        if self.update_interval != self._fast_poll_interval:
+            self.update_interval = self._fast_poll_interval
+            if self._listeners:
+                self._schedule_refresh()
+
+    async def async_set(self, command: int, data: int) -> None:
+        """Set an item, show the new value right away and verify it.
+
+        The written value is stored in coordinator data as soon as the
+        projector accepts the command. Only the items read by the same
+        command are then read back in the background. While the projector
+        warms up or cools down, the command is held until it is on.
+        """
+        if self._power_status in TRANSITION_STATES:
+            self._async_defer(command, data, (POWER_STATUS["POWER_ON"],))
+            return
         try:
-            power = await self.hass.async_add_executor_job(
-                self.projector.get_power
+            await self.client.async_set(command, data)
+        except SDCPError as err:
+            raise HomeAssistantError(f"Failed to send command to projector: {err}") from err
+        self._async_written(
+            {
+                item: decode(data)
+                for item, (item_command, decode) in QUERY_ITEMS.items()
+                if item_command == command
+            }
+        )
+
+    async def async_apply_profile(self, settings: dict[str, Any]) -> QueryResult:
+        """Send the settings that differ from the known state in one burst.
+
+        Settings are sent in PROFILE_SETTINGS order and verified together
+        once all of them were sent. Items the projector does not support are
+        skipped. The result holds the applied values and the errors of the
+        settings the projector rejected.
+        """
+        known = self.data or ProjectorState()
+        result = QueryResult()
+        changes = []
+        # The known values of the settings after a switched preset belong to
+        # the previous preset, so from there on everything is sent
+        switched = False
+        for item in PROFILE_SETTINGS:
+            if item not in settings or not self.supports(item):
+                continue
+            if not switched and known.get(item) == settings[item]:
+                continue
+            changes.append((item, settings[item]))
+            switched = switched or item in PRESET_SWITCHES
+        if self._power_status in TRANSITION_STATES:
+            for item, value in changes:
+                command, values = PROFILE_SETTINGS[item]
+                self._async_defer(command, values[value], (POWER_STATUS["POWER_ON"],))
+            return result
+        responses = await self.client.async_send_batch(
+            [
+                (
+                    ACTIONS["SET"],
+                    PROFILE_SETTINGS[item][0],
+                    PROFILE_SETTINGS[item][1][value],
+                )
+                for item, value in changes
+            ],
+            Priority.INTERACTIVE,
+        )
+        for (item, value), response in zip(changes, responses):
+            if isinstance(response, SDCPError):
+                result.errors[item] = response
+            else:
+                result.values[item] = value
+        self._async_written(result.values)
+        return result
+
+    @callback
+    def _async_written(self, expected: dict[str, Any]) -> None:
+        """Show written values right away and schedule their read-back.
+
+        After switching the input, 2D/3D mode or preset, the settings stored
+        with it are read again on the next polls.
+        """
+        if not expected:
+            return
+        now = time.monotonic()
+        for item, value in expected.items():
+            self._cache[item] = (value, now)
+        for switch in PRESET_SWITCHES.intersection(expected):
+            # The cached settings belong to the previous preset; read them again
+            for item in PRESET_DEPENDENT[switch]:
+                if item not in expected and item in self._cache:
+                    self._cache[item] = (self._cache[item][0], float("-inf"))
+        self._async_update_items(expected)
+        self._async_boost_polling()
+        self._async_verify(
+            {item: functools.partial(operator.eq, value) for item, value in expected.items()}
+        )
+
+    @property
+    def macro_timing(self) -> TimingProfile:
+        """Return the timing macros are paced with."""
+        if self._macro_timing is not None:
+            return self._macro_timing
+        return TimingProfile.for_model(self.model)
+
+    async def async_run_macro(self, macro: Macro) -> QueryResult:
+        """Run a macro as one job on the projector connection.
+
+        Steps are paced by the timing profile. A macro ending with an IR key
+        is followed by a power query, which the projector only answers once
+        it has handled the key; how much longer than usual that takes
+        calibrates the delay after IR keys. The result holds the applied
+        settings and the errors per IR key or setting.
+
+        While the projector warms up or cools down, the settings of a macro
+        without IR keys are held like any other setting; a macro with IR
+        keys is refused, as keys can't be held.
+        """
+        if self._power_status in TRANSITION_STATES:
+            if macro.has_ir:
+                raise HomeAssistantError(
+                    "The projector is warming up or cooling down and ignores IR keys; "
+                    "run the macro once it is on"
+                )
+            for step in macro.steps:
+                _, command, data = step.request
+                self._async_defer(command, data, (POWER_STATUS["POWER_ON"],))
+            return QueryResult()
+        profile = self.macro_timing
+        schedule = macro.schedule(profile)
+        calibrate = macro.steps[-1].is_ir
+        power_metrics = self.client.metrics.commands.get(COMMANDS["GET_STATUS_POWER"])
+        baseline = power_metrics.round_trip.percentile(0.5) if power_metrics else None
+        if calibrate:
+            schedule.append((0.0, (ACTIONS["GET"], COMMANDS["GET_STATUS_POWER"], None)))
+        try:
+            responses = await self.client.async_send_sequence(schedule)
+        except SDCPError as err:
+            raise HomeAssistantError(f"Failed to run macro: {err}") from err
+
+        result = QueryResult()
+        for step, response in zip(macro.steps, responses):
+            if isinstance(response, SDCPError):
+                result.errors[step.name] = response
+            elif not step.is_ir:
+                result.values[step.name] = step.value
+
+        if calibrate and baseline is not None and not isinstance(responses[-1], SDCPError):
+            ir_time = max(
+                self.client.metrics.commands[COMMANDS["GET_STATUS_POWER"]].round_trip.last
+                - baseline,
+                0.0,
             )
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with projector: {err}") from err
+            self._macro_timing = profile.calibrated(ir_time)
+            _LOGGER.debug("IR key took %.3fs, macro timing now %s", ir_time, self._macro_timing)
+            if self.data is not None:
+                self.store.async_delay_save(self._stored_state)
 
-        data: dict = {"power": power}
+        if macro.has_ir:
+            # Menu navigation may have changed anything; read it all again
+            for item, (value, _) in self._cache.items():
+                if item not in result.values:
+                    self._cache[item] = (value, float("-inf"))
+            self._async_boost_polling()
+        self._async_written(result.values)
+        return result
 
-        # Only poll additional data when projector is on
-        if power:
-            try:
-                data["muting"] = await self.hass.async_add_executor_job(
-                    self.projector.get_muting
+    async def async_set_power(self, on: bool) -> None:
+        """Switch the projector power, show it right away and verify it.
+
+        Turning on while cooling down is held until the projector reaches
+        standby, and turning off while warming up until it is on.
+        """
+        power_status = self._power_status
+        if on and power_status in COOLING_STATES:
+            self._async_defer(
+                COMMANDS["SET_POWER"], POWER_STATUS["START_UP"], (POWER_STATUS["STANDBY"],)
+            )
+            return
+        if not on:
+            # Settings waiting for the projector to be on would never apply
+            self.deferred.discard()
+            if power_status in WARMING_STATES:
+                self._async_defer(
+                    COMMANDS["SET_POWER"], POWER_STATUS["STANDBY"], (POWER_STATUS["POWER_ON"],)
                 )
-            except Exception:
-                _LOGGER.debug("Failed to get muting state")
+                return
+        try:
+            await self.client.async_set_power(on)
+        except SDCPError as err:
+            raise HomeAssistantError(f"Failed to switch projector power: {err}") from err
+        # The last advertisement no longer reflects the power state
+        self.advertisement = None
+        self._async_update_items(
+            {
+                "power_status": POWER_STATUS["START_UP" if on else "COOLING"],
+                "power": on,
+            }
+        )
+        self._async_boost_polling()
+        self._async_verify(
+            {"power_status": lambda power_status: decode_power(power_status) == on}
+        )
 
-            try:
-                data["lamp_hours"] = await self.hass.async_add_executor_job(
-                    self.projector.get_lamp_hours
+    @property
+    def _power_status(self) -> int | None:
+        """Return the last known power status."""
+        return self.data.power_status if self.data is not None else None
+
+    @callback
+    def _async_defer(self, command: int, data: int, ready_states: tuple[int, ...]) -> None:
+        """Hold a command until the projector is in one of ready_states."""
+        _LOGGER.debug("Projector is busy, holding command 0x%04x", command)
+        self.deferred.defer(command, data, ready_states)
+        if self._deferred_task is None:
+            self._deferred_task = self.hass.async_create_background_task(
+                self._async_flush_deferred(), "sony_sdcp deferred commands"
+            )
+
+    async def _async_flush_deferred(self) -> None:
+        """Send held commands in order as soon as the projector is ready.
+
+        Polls, which run at the fast interval during warm-up and cool-down,
+        and SDAP advertisements wake the loop when the power state changes.
+        The power state is only read here if neither updated it by the time
+        the oldest command expires.
+        """
+        try:
+            while self.deferred.pending:
+                for deferred in self.deferred.pop_ready(self._power_status):
+                    await self._async_send_deferred(deferred)
+                if (expires_at := self.deferred.next_expiry) is None:
+                    break
+                self._deferred_wake.clear()
+                try:
+                    async with asyncio.timeout(max(expires_at - time.monotonic(), 0)):
+                        await self._deferred_wake.wait()
+                except TimeoutError:
+                    result = await self.async_query(["power_status"], Priority.VERIFY)
+                    if result.ok:
+                        self._async_update_items(
+                            {"power_status": result.values["power_status"]}
+                        )
+        finally:
+            self._deferred_task = None
+
+    async def _async_send_deferred(self, deferred: DeferredCommand) -> None:
+        """Send a held command."""
+        try:
+            if deferred.command == COMMANDS["SET_POWER"]:
+                await self.async_set_power(deferred.data == POWER_STATUS["START_UP"])
+            else:
+                await self.async_set(deferred.command, deferred.data)
+        except HomeAssistantError as err:
+            self.deferred.stats.failed += 1
+            _LOGGER.warning("Failed to send held command 0x%04x: %s", deferred.command, err)
+        else:
+            self.deferred.stats.sent += 1
+
+    @callback
+    def _async_update_items(self, values: dict[str, Any]) -> None:
+        """Merge values into coordinator data and notify entities."""
+        if self.data is None or not values:
+            return
+        if "power_status" in values:
+            values = {**values, "power": decode_power(values["power_status"])}
+        if (data := self.data.evolve(values)) is not self.data:
+            self.data = data
+            self.async_update_listeners()
+
+    @callback
+    def _async_verify(self, checks: dict[str, Callable[[Any], bool]]) -> None:
+        """Read back written items until each passes its check."""
+        key = frozenset(checks)
+        if (task := self._verify_tasks.pop(key, None)) is not None:
+            task.cancel()
+        self._verify_tasks[key] = self.hass.async_create_background_task(
+            self._async_verify_items(key, checks), "sony_sdcp verify"
+        )
+
+    async def _async_verify_items(
+        self, key: frozenset[str], checks: dict[str, Callable[[Any], bool]]
+    ) -> None:
+        """Read back items, retrying while the projector applies the change."""
+        try:
+            for delay in VERIFY_DELAYS:
+                await asyncio.sleep(delay)
+                result = await self.async_query(checks, Priority.VERIFY)
+                now = time.monotonic()
+                for item, value in result.values.items():
+                    if item in self._cache:
+                        self._cache[item] = (value, now)
+                self._async_update_items(
+                    {
+                        item: value
+                        for item, value in result.values.items()
+                        if self.data is not None and self.data.get(item) != value
+                    }
                 )
-            except Exception:
-                _LOGGER.debug("Failed to get lamp hours")
+                if result.ok and all(
+                    check(result.values[item]) for item, check in checks.items()
+                ):
+                    return
+
+            _LOGGER.debug("Projector did not confirm %s", ", ".join(checks))
+            for item in checks:
+                if item in self._cache:
+                    # Read it again on the next poll
+                    self._cache[item] = (self._cache[item][0], float("-inf"))
+        finally:
+            if self._verify_tasks.get(key) is asyncio.current_task():
+                del self._verify_tasks[key]
+
+    def _due_items(self, items: Iterable[str]) -> list[str]:
+        """Return the items whose cached value has expired."""
+        now = time.monotonic()
+        return [
+            item
+            for item in items
+            if item not in self._cache
+            or now - self._cache[item][1] >= ITEM_TTLS[item] - _TTL_SLACK
+        ]
+
+    def _next_settings(self) -> list[str]:
+        """Return the settings to read this poll, least recently read first."""
+        due = sorted(
+            self._due_items(self._setting_items),
+            key=lambda item: self._cache[item][1] if item in self._cache else float("-inf"),
+        )
+        return due[:SETTINGS_PER_POLL]
 
+    def _cached_data(self, items: Iterable[str]) -> dict[str, Any]:
+        """Return the cached values of the given items."""
+        return {item: self._cache[item][0] for item in items if item in self._cache}
+
+    def _snapshot(self, values: dict[str, Any]) -> ProjectorState:
+        """Return the next snapshot, holding exactly the given items."""
+        return (self.data or ProjectorState()).evolve(values, replace=True)
+
+    def _standby_data(self, power_status: int) -> ProjectorState:
+        """Build coordinator data for a projector in standby."""
+        # Anything else may change before the projector is next turned on
+        for item in set(self._cache) - set(STANDBY_ITEMS):
+            del self._cache[item]
+        # Settings can't be changed in standby, so they stay as fresh as
+        # when they were last read
+        now = time.monotonic()
+        for item in SETTING_ITEMS:
+            if item in self._cache:
+                self._cache[item] = (self._cache[item][0], now)
+        return self._snapshot(
+            {
+                "power_status": power_status,
+                "power": False,
+                **self._cached_data(STANDBY_ITEMS),
+            }
+        )
+
+    async def async_query(
+        self, items: Iterable[str], priority: Priority = Priority.POLL
+    ) -> QueryResult:
+        """Read several items in one burst over the projector connection."""
+        items = list(items)
+        responses = await self.client.async_send_batch(
+            [(ACTIONS["GET"], QUERY_ITEMS[item][0], None) for item in items],
+            priority,
+        )
+        result = QueryResult()
+        for item, response in zip(items, responses):
+            if isinstance(response, SDCPError):
+                result.errors[item] = response
+                continue
             try:
-                data["input"] = await self.hass.async_add_executor_job(
-                    self.projector.get_input
+                result.values[item] = QUERY_ITEMS[item][1](response)
+            except (TypeError, ValueError):
+                result.errors[item] = SDCPDataError(
+                    f"Unexpected response data for {item}: {response!r}"
                 )
-            except Exception:
-                _LOGGER.debug("Failed to get input")
+        return result
+
+    async def _async_update_data(self) -> ProjectorState:
+        """Fetch state from projector."""
+        if self._advertised_standby():
+            # Nothing else to read in standby; no need to open a connection
+            power_status = self.advertisement.power_state
+            self._set_next_interval(power_status)
+            return self._standby_data(power_status)
+
+        if self.client.circuit.blocked:
+            # Known to be unreachable; don't take a poll slot just to fail
+            self._set_next_interval(None)
+            raise UpdateFailed(
+                f"Projector is unreachable, next check in {self.client.circuit.retry_in:.0f}s"
+            )
+
+        async with self.hub.async_poll_slot():
+            return await self._async_poll()
+
+    async def _async_poll(self) -> ProjectorState:
+        """Read power and any expired items over SDCP."""
+        result = await self.async_query(["power_status"])
+        if not result.ok:
+            self._set_next_interval(None)
+            raise UpdateFailed(
+                f"Error communicating with projector: {result.errors['power_status']}"
+            )
+
+        power_status = result.values["power_status"]
+        self._set_next_interval(power_status)
+        if not decode_power(power_status):
+            return self._standby_data(power_status)
+
+        if self.capabilities is None:
+            # First time on: read everything once to learn what the model
+            # supports
+            due = [*POWERED_ITEMS, *SETTING_ITEMS]
+        else:
+            # Only read items whose cached value has expired, and spread the
+            # settings sweep over several polls
+            due = self._due_items(self._powered_items) + self._next_settings()
+        if due:
+            # A write may run between the reads; what it cached, or expired,
+            # is newer than what this poll read
+            cached = {item: self._cache.get(item) for item in due}
+            result = await self.async_query(due)
+            now = time.monotonic()
+            for item, value in result.values.items():
+                if self._cache.get(item) is cached[item]:
+                    self._cache[item] = (value, now)
+            for item, err in result.errors.items():
+                _LOGGER.debug("Failed to get %s: %s", item, err)
+                if item in SETTING_ITEMS and self._cache.get(item) is cached[item]:
+                    # Not readable in the current mode; retry after the TTL
+                    self._cache[item] = (self._cache.get(item, (None,))[0], now)
+            if self.capabilities is None:
+                self._async_learn_capabilities(result)
+
+        return self._snapshot(
+            {
+                "power_status": power_status,
+                "power": True,
+                **self._cached_data(POWERED_ITEMS),
+                **self._cached_data(SETTING_ITEMS),
+            }
+        )
+
+    @callback
+    def _async_learn_capabilities(self, result: QueryResult) -> None:
+        """Keep the items a probe found unsupported in the config entry.
+
+        The entry is reloaded if anything is unsupported, so its entities
+        are dropped.
+        """
+        if (capabilities := Capabilities.from_errors(self.model, result.errors)) is None:
+            # Not every item answered; try again on the next poll
+            return
+        _LOGGER.debug(
+            "Projector %s does not support %s",
+            capabilities.model,
+            ", ".join(sorted(capabilities.unsupported)) or "nothing",
+        )
+        self._set_capabilities(capabilities)
+        for item in capabilities.unsupported:
+            self._cache.pop(item, None)
+        self.hass.config_entries.async_update_entry(
+            self.entry,
+            data={**self.entry.data, CONF_CAPABILITIES: capabilities.as_dict()},
+        )
+        if capabilities.unsupported:
+            self.hass.config_entries.async_schedule_reload(self.entry_id)
 
-        return data
+    async def async_shutdown(self) -> None:
+        """Cancel polling and close the projector connection."""
+        await super().async_shutdown()
+        if self._sdap_unsub is not None:
+            self._sdap_unsub()
+            self._sdap_unsub = None
+        await self.ir_queue.async_shutdown()
+        self.deferred.discard()
+        if self._deferred_task is not None:
+            self._deferred_task.cancel()
+        for task in self._verify_tasks.values():
+            task.cancel()
+        await self.client.async_close()
+        if self.data is not None:
+            await self.store.async_save(self._stored_state())
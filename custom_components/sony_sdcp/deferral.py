@@ -0,0 +1,91 @@
+"""Commands held back while a Sony projector warms up or cools down."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from dataclasses import dataclass
+import logging
+import time
+
+from .const import DEFER_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class DeferredCommand:
+    """A SET command waiting for the projector to reach a power state."""
+
+    command: int
+    data: int
+    # Power states in which the command can be sent
+    ready_states: Collection[int]
+    expires_at: float
+
+
+@dataclass(slots=True)
+class DeferralStats:
+    """Counters for the deferred command queue."""
+
+    deferred: int = 0
+    replaced: int = 0
+    expired: int = 0
+    sent: int = 0
+    failed: int = 0
+
+
+class DeferredCommandQueue:
+    """Hold SET commands until the projector can accept them.
+
+    Commands are kept per SDCP command, so a later value replaces an
+    earlier one and moves to the back of the queue. Commands still waiting
+    after DEFER_TIMEOUT seconds are dropped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        self.stats = DeferralStats()
+        self._commands: dict[int, DeferredCommand] = {}
+
+    @property
+    def pending(self) -> int:
+        """Return the number of waiting commands."""
+        return len(self._commands)
+
+    @property
+    def next_expiry(self) -> float | None:
+        """Return the monotonic time the oldest command expires, if any."""
+        return min((deferred.expires_at for deferred in self._commands.values()), default=None)
+
+    def defer(self, command: int, data: int, ready_states: Collection[int]) -> None:
+        """Hold a command until the projector is in one of ready_states."""
+        if self._commands.pop(command, None) is not None:
+            self.stats.replaced += 1
+        else:
+            self.stats.deferred += 1
+        self._commands[command] = DeferredCommand(
+            command, data, ready_states, time.monotonic() + DEFER_TIMEOUT
+        )
+
+    def discard(self, command: int | None = None) -> None:
+        """Drop a waiting command, or every waiting command."""
+        if command is None:
+            self._commands.clear()
+        else:
+            self._commands.pop(command, None)
+
+    def pop_ready(self, power_status: int | None) -> list[DeferredCommand]:
+        """Remove and return, in order, the commands that can be sent now."""
+        now = time.monotonic()
+        ready = []
+        for command, deferred in list(self._commands.items()):
+            if deferred.expires_at <= now:
+                del self._commands[command]
+                self.stats.expired += 1
+                _LOGGER.warning(
+                    "Dropped command 0x%04x, the projector was not ready in time", command
+                )
+            elif power_status in deferred.ready_states:
+                del self._commands[command]
+                ready.append(deferred)
+        return ready
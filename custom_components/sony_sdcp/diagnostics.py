@@ -0,0 +1,60 @@
+"""Diagnostics support for Sony SDCP."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import SonySDCPCoordinator
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: SonySDCPCoordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "capabilities": coordinator.capabilities.as_dict()
+        if coordinator.capabilities
+        else None,
+        "data": coordinator.data.as_dict() if coordinator.data else None,
+        "data_version": coordinator.data.version if coordinator.data else None,
+        "update_interval": coordinator.update_interval.total_seconds()
+        if coordinator.update_interval
+        else None,
+        "connection": {
+            "connected": client.connected,
+            "waiting": client.scheduler.waiting,
+            "circuit": {
+                "state": client.circuit.state,
+                "failures": client.circuit.failures,
+                "trips": client.circuit.trips,
+                "rejected": client.circuit.rejected,
+                "retry_in": client.circuit.retry_in,
+            },
+        },
+        "commands": client.metrics.as_dict(),
+        "ir_queue": {
+            "pending": coordinator.ir_queue.pending,
+            **asdict(coordinator.ir_queue.stats),
+        },
+        "deferred": {
+            "pending": coordinator.deferred.pending,
+            **asdict(coordinator.deferred.stats),
+        },
+        "hub": asdict(coordinator.hub.stats),
+        "macro_timing": asdict(coordinator.macro_timing),
+    }
@@ -0,0 +1,119 @@
+"""Network discovery of Sony projectors."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from ipaddress import IPv4Address, IPv4Network, ip_network
+import logging
+
+from homeassistant.components import network
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_MAX_PREFIX,
+    DISCOVERY_PROBE_TIMEOUT,
+    DISCOVERY_TIMEOUT,
+    SDCP_PORT,
+)
+from .sdap import SDAPAdvertisement, async_subscribe as async_subscribe_sdap
+from .sdcp import SDCPClient, SDCPError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class DiscoveredProjector:
+    """A projector found on the network."""
+
+    host: str
+    model: str | None = None
+    serial_number: int | None = None
+
+    @property
+    def label(self) -> str:
+        """Return a name to show when picking the projector."""
+        if self.model is None:
+            return f"Sony projector ({self.host})"
+        return f"{self.model} #{self.serial_number} ({self.host})"
+
+
+async def _async_local_networks(hass: HomeAssistant) -> list[IPv4Network]:
+    """Return the IPv4 networks of the enabled adapters.
+
+    Networks larger than DISCOVERY_MAX_PREFIX are narrowed down to the
+    block of that size around our own address.
+    """
+    networks: set[IPv4Network] = set()
+    for adapter in await network.async_get_adapters(hass):
+        if not adapter["enabled"]:
+            continue
+        for ipv4 in adapter["ipv4"]:
+            address = IPv4Address(ipv4["address"])
+            if address.is_loopback or address.is_link_local:
+                continue
+            prefix = max(ipv4["network_prefix"], DISCOVERY_MAX_PREFIX)
+            networks.add(ip_network(f"{address}/{prefix}", strict=False))
+    return sorted(networks)
+
+
+async def _async_probe(host: str, slots: asyncio.Semaphore) -> bool:
+    """Return True if host answers an SDCP power query."""
+    async with slots:
+        client = SDCPClient(host, SDCP_PORT, timeout=DISCOVERY_PROBE_TIMEOUT)
+        try:
+            await client.async_get_power()
+        except SDCPError:
+            return False
+        finally:
+            await client.async_close()
+        return True
+
+
+async def async_discover(
+    hass: HomeAssistant, timeout: float = DISCOVERY_TIMEOUT
+) -> list[DiscoveredProjector]:
+    """Find projectors by SDAP advertisements and by probing local subnets.
+
+    Every address of the local networks is probed on the SDCP port, at most
+    DISCOVERY_CONCURRENCY at a time, while SDAP advertisements are collected
+    for timeout seconds. Advertisements supply the model and serial number;
+    projectors that only answered a probe are returned without them.
+    """
+    found: dict[str, DiscoveredProjector] = {}
+
+    @callback
+    def _async_advertised(advertisement: SDAPAdvertisement) -> None:
+        found[advertisement.host] = DiscoveredProjector(
+            advertisement.host, advertisement.product_name, advertisement.serial_number
+        )
+
+    unsubscribe = await async_subscribe_sdap(hass, None, _async_advertised)
+
+    slots = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+    probes = {
+        asyncio.create_task(_async_probe(str(host), slots)): str(host)
+        for net in await _async_local_networks(hass)
+        for host in net.hosts()
+    }
+    try:
+        if probes:
+            done, pending = await asyncio.wait(probes, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            for task in done:
+                host = probes[task]
+                if task.result() and host not in found:
+                    found[host] = DiscoveredProjector(host)
+        else:
+            await asyncio.sleep(timeout)
+    finally:
+        for task in probes:
+            task.cancel()
+        await asyncio.gather(*probes, return_exceptions=True)
+        if unsubscribe is not None:
+            unsubscribe()
+
+    _LOGGER.debug("Discovered projectors: %s", list(found.values()))
+    return sorted(found.values(), key=lambda projector: IPv4Address(projector.host))
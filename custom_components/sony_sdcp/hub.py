@@ -0,0 +1,108 @@
+"""Domain-wide poll scheduling across all Sony SDCP projectors."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+import contextlib
+from dataclasses import dataclass
+from datetime import timedelta
+import random
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DEFAULT_POLL_INTERVAL,
+    DOMAIN,
+    MAX_CONCURRENT_POLLS,
+    POLL_JITTER,
+    POLL_STAGGER,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import SonySDCPCoordinator
+
+DATA_HUB = f"{DOMAIN}_hub"
+
+
+@dataclass(slots=True)
+class HubStats:
+    """Aggregate polling counters for all projectors."""
+
+    polls: int = 0
+    failed_polls: int = 0
+    active_polls: int = 0
+    peak_active_polls: int = 0
+    delayed_polls: int = 0
+    total_wait: float = 0.0
+    total_poll_time: float = 0.0
+
+
+class SonySDCPHub:
+    """Own all projector coordinators and spread their polls out.
+
+    Each projector added gets its first scheduled poll shifted by
+    POLL_STAGGER seconds from the previous one, every interval is jittered
+    by up to POLL_JITTER, and at most MAX_CONCURRENT_POLLS polls run at once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the hub."""
+        self.coordinators: dict[str, SonySDCPCoordinator] = {}
+        self.stats = HubStats()
+        self._poll_slots = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+        self._offsets: dict[str, float] = {}
+        self._next_offset = 0.0
+
+    @callback
+    def async_add(self, entry_id: str, coordinator: SonySDCPCoordinator) -> None:
+        """Register a projector coordinator."""
+        self.coordinators[entry_id] = coordinator
+        self._offsets[entry_id] = self._next_offset
+        self._next_offset = (self._next_offset + POLL_STAGGER) % DEFAULT_POLL_INTERVAL
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Unregister a projector coordinator."""
+        self.coordinators.pop(entry_id, None)
+        self._offsets.pop(entry_id, None)
+
+    def spread(self, entry_id: str, interval: timedelta) -> timedelta:
+        """Return the interval with this projector's stagger and jitter applied."""
+        # The stagger offset only shifts the first scheduled poll
+        if offset := self._offsets.get(entry_id, 0.0):
+            self._offsets[entry_id] = 0.0
+        jitter = random.uniform(-POLL_JITTER, POLL_JITTER)
+        return interval * (1 + jitter) + timedelta(seconds=offset)
+
+    @contextlib.asynccontextmanager
+    async def async_poll_slot(self) -> AsyncIterator[None]:
+        """Run a poll once fewer than MAX_CONCURRENT_POLLS are in flight."""
+        stats = self.stats
+        if self._poll_slots.locked():
+            stats.delayed_polls += 1
+        queued = time.monotonic()
+        async with self._poll_slots:
+            started = time.monotonic()
+            stats.total_wait += started - queued
+            stats.polls += 1
+            stats.active_polls += 1
+            stats.peak_active_polls = max(stats.peak_active_polls, stats.active_polls)
+            try:
+                yield
+            except Exception:
+                stats.failed_polls += 1
+                raise
+            finally:
+                stats.active_polls -= 1
+                stats.total_poll_time += time.monotonic() - started
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> SonySDCPHub:
+    """Return the domain hub, creating it on first use."""
+    if (hub := hass.data.get(DATA_HUB)) is None:
+        hub = hass.data[DATA_HUB] = SonySDCPHub()
+    return hub
@@ -0,0 +1,188 @@
+"""Ordered, coalescing IR command queue for Sony SDCP."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Sequence
+import contextlib
+from dataclasses import dataclass
+import logging
+import time
+
+from pysdcp_extended.protocol import COMMANDS_IR
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    IR_COMMAND_INTERVAL,
+    IR_COMMANDS,
+    IR_MAX_PENDING,
+    IR_MAX_REPEATS,
+    IR_MAX_STREAM_FRAMES,
+)
+from .sdcp import SDCPClient, SDCPError
+
+_LOGGER = logging.getLogger(__name__)
+
+# IR command names accepted from users: protocol keys and display names
+_COMMAND_KEYS = {
+    **{command_key.lower(): command_key for command_key in IR_COMMANDS.values()},
+    **{name.lower(): command_key for name, command_key in IR_COMMANDS.items()},
+}
+
+
+def resolve_ir_command(name: str) -> int | None:
+    """Return the IR command for a protocol key or display name."""
+    if (command_key := _COMMAND_KEYS.get(name.lower())) is None:
+        return None
+    return COMMANDS_IR[command_key]
+
+
+@dataclass(slots=True)
+class _Run:
+    """Consecutive frames of the same IR key.
+
+    Frames are started interval apart, and the next run starts delay after
+    the last frame. Runs of button presses can absorb further presses.
+    """
+
+    command: int
+    count: int
+    interval: float = IR_COMMAND_INTERVAL
+    delay: float = IR_COMMAND_INTERVAL
+    mergeable: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class IRStep:
+    """Part of an IR stream: one key sent frames times."""
+
+    command: int
+    frames: int = 1
+    interval: float = IR_COMMAND_INTERVAL
+    delay: float = IR_COMMAND_INTERVAL
+
+
+@dataclass(slots=True)
+class IRQueueStats:
+    """Counters for the IR command queue."""
+
+    sent: int = 0
+    merged: int = 0
+    dropped: int = 0
+    failed: int = 0
+
+
+class IRCommandQueue:
+    """Serialize IR presses and stream repeated keys at a steady pace.
+
+    Presses of the same key in a row are merged into one run that is sent
+    frame by frame, IR_COMMAND_INTERVAL apart, over the projector
+    connection. Presses beyond IR_MAX_REPEATS per run or IR_MAX_PENDING
+    queued runs are dropped. Frames are paced from when they were due
+    rather than from when the previous one finished, so the cadence does
+    not drift with the round trip.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: SDCPClient) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self.client = client
+        self.stats = IRQueueStats()
+        self._runs: deque[_Run] = deque()
+        self._task: asyncio.Task | None = None
+        self._next_at = 0.0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of queued presses."""
+        return sum(run.count for run in self._runs)
+
+    @callback
+    def async_press(self, command: int, repeats: int = 1) -> None:
+        """Queue an IR command."""
+        # The run being sent can still absorb presses of the same key
+        if (
+            self._runs
+            and self._runs[-1].mergeable
+            and self._runs[-1].command == command
+        ):
+            run = self._runs[-1]
+            accepted = min(repeats, IR_MAX_REPEATS - run.count)
+            run.count += accepted
+            self.stats.merged += accepted
+        elif len(self._runs) < IR_MAX_PENDING:
+            accepted = min(repeats, IR_MAX_REPEATS)
+            self._runs.append(_Run(command, accepted))
+        else:
+            accepted = 0
+
+        if dropped := repeats - accepted:
+            self.stats.dropped += dropped
+            _LOGGER.debug("IR queue full, dropped %s press(es) of 0x%04x", dropped, command)
+
+        self._async_start()
+
+    @callback
+    def async_stream(self, steps: Sequence[IRStep]) -> bool:
+        """Queue a sequence of IR keys to be sent as a whole.
+
+        Returns False, queueing nothing, if the queue is full or the
+        sequence is longer than IR_MAX_STREAM_FRAMES frames.
+        """
+        frames = sum(step.frames for step in steps)
+        if len(self._runs) >= IR_MAX_PENDING or frames > IR_MAX_STREAM_FRAMES:
+            self.stats.dropped += frames
+            _LOGGER.debug("IR queue full, dropped a stream of %s frame(s)", frames)
+            return False
+        self._runs.extend(
+            _Run(step.command, step.frames, step.interval, step.delay, False)
+            for step in steps
+            if step.frames > 0
+        )
+        self._async_start()
+        return True
+
+    @callback
+    def _async_start(self) -> None:
+        """Start sending if there is something to send."""
+        if self._task is None and self._runs:
+            self._task = self.hass.async_create_background_task(
+                self._async_drain(), "sony_sdcp IR queue"
+            )
+
+    async def _async_drain(self) -> None:
+        """Send queued runs in order, pacing the frames."""
+        try:
+            while self._runs:
+                run = self._runs[0]
+                if (wait := self._next_at - time.monotonic()) > 0:
+                    await asyncio.sleep(wait)
+                due = max(self._next_at, time.monotonic())
+                try:
+                    await self.client.async_send_ir(run.command)
+                except SDCPError as err:
+                    # The rest of the run would fail the same way
+                    self.stats.failed += run.count
+                    self._runs.popleft()
+                    self._next_at = time.monotonic() + run.delay
+                    _LOGGER.warning("Failed to send IR command 0x%04x: %s", run.command, err)
+                    continue
+                self.stats.sent += 1
+                run.count -= 1
+                if run.count == 0:
+                    self._runs.popleft()
+                    self._next_at = due + run.delay
+                else:
+                    self._next_at = due + run.interval
+        finally:
+            self._task = None
+
+    async def async_shutdown(self) -> None:
+        """Drop queued presses and stop sending."""
+        self._runs.clear()
+        if (task := self._task) is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
@@ -0,0 +1,173 @@
+"""Compiled IR and setting macros for Sony SDCP."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import Any
+
+from pysdcp_extended.protocol import ACTIONS
+import voluptuous as vol
+
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    MACRO_CALIBRATION_MARGIN,
+    MACRO_CALIBRATION_WEIGHT,
+    MACRO_DEFAULT_TIMING,
+    MACRO_IR_DELAY_MAX,
+    MACRO_IR_DELAY_MIN,
+    MACRO_MAX_DELAY,
+    MACRO_MAX_STEPS,
+    MACRO_TIMING_PROFILES,
+)
+from .ir import resolve_ir_command
+
+CONF_COMMAND = "command"
+CONF_DELAY = "delay"
+CONF_REPEAT = "repeat"
+
+_IR_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_COMMAND): cv.string,
+        vol.Optional(CONF_REPEAT, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MACRO_MAX_STEPS)
+        ),
+    }
+)
+_DELAY_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DELAY): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MACRO_MAX_DELAY)
+        )
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TimingProfile:
+    """Seconds to wait after each kind of macro step."""
+
+    ir_delay: float
+    set_delay: float
+
+    @classmethod
+    def for_model(cls, model: str | None) -> TimingProfile:
+        """Return the default profile of a projector model."""
+        for prefix, timing in MACRO_TIMING_PROFILES.items():
+            if model and model.startswith(prefix):
+                return cls(*timing)
+        return cls(*MACRO_DEFAULT_TIMING)
+
+    def calibrated(self, ir_time: float) -> TimingProfile:
+        """Return the profile moved towards a measured IR key handling time."""
+        target = min(
+            max(ir_time * MACRO_CALIBRATION_MARGIN, MACRO_IR_DELAY_MIN),
+            MACRO_IR_DELAY_MAX,
+        )
+        return replace(
+            self,
+            ir_delay=self.ir_delay + MACRO_CALIBRATION_WEIGHT * (target - self.ir_delay),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MacroStep:
+    """One command of a compiled macro."""
+
+    request: tuple[int, int, int | None]
+    # IR key or setting name
+    name: str
+    # Setting value written by the command, None for an IR key
+    value: Any = None
+    # Minimum pause before the command, in seconds
+    pause: float = 0.0
+
+    @property
+    def is_ir(self) -> bool:
+        """Return True if the step sends an IR key."""
+        return self.value is None
+
+
+@dataclass(frozen=True, slots=True)
+class Macro:
+    """A sequence of IR keys and settings resolved to SDCP requests."""
+
+    steps: tuple[MacroStep, ...]
+
+    @property
+    def has_ir(self) -> bool:
+        """Return True if any step sends an IR key."""
+        return any(step.is_ir for step in self.steps)
+
+    def schedule(
+        self, profile: TimingProfile
+    ) -> list[tuple[float, tuple[int, int, int | None]]]:
+        """Return (delay, request) pairs paced by a timing profile."""
+        schedule = []
+        previous: MacroStep | None = None
+        for step in self.steps:
+            if previous is None:
+                delay = 0.0
+            elif previous.is_ir:
+                delay = profile.ir_delay
+            else:
+                delay = profile.set_delay
+            schedule.append((max(delay, step.pause), step.request))
+            previous = step
+        return schedule
+
+
+def compile_macro(
+    sequence: list[Any], settings: Mapping[str, tuple[int, dict[Any, int]]]
+) -> Macro:
+    """Compile macro steps, raising vol.Invalid for a step that is not valid.
+
+    A step is an IR key name, a mapping with an IR key as command and an
+    optional repeat count, a mapping with a delay in seconds, or a mapping
+    of settings to values, which are sent in the given order. Delays add up
+    to at most MACRO_MAX_DELAY seconds, so with MACRO_MAX_STEPS a macro
+    can't run for long.
+    """
+    steps: list[MacroStep] = []
+    pause = 0.0
+    total_delay = 0.0
+    for index, step in enumerate(sequence):
+        path = [index]
+        if isinstance(step, str):
+            step = {CONF_COMMAND: step}
+        if not isinstance(step, dict):
+            raise vol.Invalid("expected an IR command or a mapping", path)
+        if CONF_DELAY in step:
+            delay = _DELAY_STEP_SCHEMA(step)[CONF_DELAY]
+            total_delay += delay
+            if total_delay > MACRO_MAX_DELAY:
+                raise vol.Invalid(
+                    f"a macro can have at most {MACRO_MAX_DELAY} seconds of delays", path
+                )
+            pause += delay
+            continue
+        if CONF_COMMAND in step:
+            step = _IR_STEP_SCHEMA(step)
+            if (command := resolve_ir_command(step[CONF_COMMAND])) is None:
+                raise vol.Invalid(f"unknown IR command: {step[CONF_COMMAND]}", path)
+            request = (ACTIONS["SET"], command, None)
+            steps.append(MacroStep(request, step[CONF_COMMAND], pause=pause))
+            steps.extend(
+                MacroStep(request, step[CONF_COMMAND]) for _ in range(step[CONF_REPEAT] - 1)
+            )
+            pause = 0.0
+            continue
+        for item, value in step.items():
+            if item not in settings:
+                raise vol.Invalid(f"unknown setting: {item}", path)
+            command, values = settings[item]
+            value = (cv.boolean if True in values else vol.In(list(values)))(value)
+            steps.append(MacroStep((ACTIONS["SET"], command, values[value]), item, value, pause))
+            pause = 0.0
+
+    if not steps:
+        raise vol.Invalid("a macro needs at least one command")
+    if len(steps) > MACRO_MAX_STEPS:
+        raise vol.Invalid(f"a macro can have at most {MACRO_MAX_STEPS} steps")
+    return Macro(tuple(steps))
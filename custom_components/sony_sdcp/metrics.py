@@ -0,0 +1,135 @@
+"""Rolling per-command latency and error metrics for Sony SDCP."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import LATENCY_BUCKETS, METRICS_WINDOW
+
+
+class LatencyHistogram:
+    """Latencies of the last METRICS_WINDOW samples, in seconds."""
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self._samples: deque[float] = deque(maxlen=METRICS_WINDOW)
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    @property
+    def last(self) -> float | None:
+        """Return the latest sample, or None without samples."""
+        return self._samples[-1] if self._samples else None
+
+    def add(self, value: float) -> None:
+        """Add a sample, pushing out the oldest one once the window is full."""
+        self._samples.append(value)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the nearest-rank percentile, or None without samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+    def buckets(self) -> dict[str, int]:
+        """Return sample counts per LATENCY_BUCKETS upper bound."""
+        counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        for value in self._samples:
+            counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        labels = [f"<={bound * 1000:g}ms" for bound in LATENCY_BUCKETS]
+        return dict(zip([*labels, "inf"], counts))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary for diagnostics."""
+        return {
+            "samples": len(self._samples),
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "max": max(self._samples, default=None),
+            "buckets": self.buckets(),
+        }
+
+
+@dataclass(slots=True)
+class CommandMetrics:
+    """Metrics of one SDCP command."""
+
+    sent: int = 0
+    retries: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+    queue_wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+    connect: LatencyHistogram = field(default_factory=LatencyHistogram)
+    round_trip: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary for diagnostics."""
+        return {
+            "sent": self.sent,
+            "retries": self.retries,
+            "errors": dict(self.errors),
+            "queue_wait": self.queue_wait.as_dict(),
+            "connect": self.connect.as_dict(),
+            "round_trip": self.round_trip.as_dict(),
+        }
+
+
+class SDCPMetrics:
+    """Metrics of every command sent to one projector.
+
+    Each command is timed in three parts: waiting for its turn on the
+    connection, opening a connection if one was needed, and the round trip
+    itself. The same figures are also kept across all commands.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.commands: dict[int, CommandMetrics] = {}
+        self.total = CommandMetrics()
+
+    def record(
+        self,
+        command: int,
+        queue_wait: float,
+        connect: float | None,
+        round_trip: float,
+        error: Exception | None = None,
+        retried: bool = False,
+    ) -> None:
+        """Record one command.
+
+        connect is None when an open connection was reused.
+        """
+        if (metrics := self.commands.get(command)) is None:
+            metrics = self.commands[command] = CommandMetrics()
+        for target in (metrics, self.total):
+            target.sent += 1
+            target.retries += retried
+            target.queue_wait.add(queue_wait)
+            if connect is not None:
+                target.connect.add(connect)
+            if error is None:
+                target.round_trip.add(round_trip)
+            else:
+                target.errors[type(error).__name__] += 1
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of failed commands."""
+        return self.total.errors.total()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary for diagnostics."""
+        return {
+            "total": self.total.as_dict(),
+            "commands": {
+                f"0x{command:04x}": metrics.as_dict()
+                for command, metrics in sorted(self.commands.items())
+            },
+        }
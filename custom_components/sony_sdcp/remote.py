@@ -0,0 +1,110 @@
+"""Remote platform for Sony SDCP projector IR commands."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import math
+from typing import Any
+
+from homeassistant.components.remote import (
+    ATTR_DELAY_SECS,
+    ATTR_HOLD_SECS,
+    ATTR_NUM_REPEATS,
+    DEFAULT_DELAY_SECS,
+    DEFAULT_HOLD_SECS,
+    DEFAULT_NUM_REPEATS,
+    RemoteEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, IR_COMMAND_INTERVAL
+from .coordinator import SonySDCPCoordinator
+from .ir import IRStep, resolve_ir_command
+from .state import item_mask
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Sony SDCP remote from a config entry."""
+    coordinator: SonySDCPCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([SonySDCPRemote(coordinator, entry)])
+
+
+def build_ir_steps(
+    commands: Iterable[int],
+    num_repeats: int = DEFAULT_NUM_REPEATS,
+    delay_secs: float = DEFAULT_DELAY_SECS,
+    hold_secs: float = DEFAULT_HOLD_SECS,
+) -> list[IRStep]:
+    """Return the IR stream for a send_command call.
+
+    A held key is resent every IR_COMMAND_INTERVAL for hold_secs, like a
+    physical remote does while a key is down. Keys are sent delay_secs
+    apart, and a key repeated without hold becomes a single step.
+    """
+    commands = list(commands)
+    delay = max(delay_secs, IR_COMMAND_INTERVAL)
+    frames = max(1, math.ceil(hold_secs / IR_COMMAND_INTERVAL)) if hold_secs else 1
+    if frames == 1 and len(commands) == 1:
+        return [IRStep(commands[0], num_repeats, delay, delay)]
+    return [
+        IRStep(command, frames, IR_COMMAND_INTERVAL, delay)
+        for _ in range(num_repeats)
+        for command in commands
+    ]
+
+
+class SonySDCPRemote(CoordinatorEntity[SonySDCPCoordinator], RemoteEntity):
+    """Remote entity sending IR commands and switching the power."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Remote"
+    _attr_icon = "mdi:remote"
+
+    def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, context=item_mask("power"))
+        self._attr_unique_id = f"{entry.entry_id}_remote"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": entry.data[CONF_NAME],
+            "manufacturer": "Sony",
+        }
+
+    @property
+    def is_on(self) -> bool | None:
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.power
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        await self.coordinator.async_set_power(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        await self.coordinator.async_set_power(False)
+
+    async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
+        """Queue IR commands, repeated and held as requested."""
+        commands = []
+        for name in command:
+            if (ir_command := resolve_ir_command(name)) is None:
+                raise ServiceValidationError(f"Unknown IR command: {name}")
+            commands.append(ir_command)
+
+        steps = build_ir_steps(
+            commands,
+            kwargs.get(ATTR_NUM_REPEATS, DEFAULT_NUM_REPEATS),
+            kwargs.get(ATTR_DELAY_SECS, DEFAULT_DELAY_SECS),
+            kwargs.get(ATTR_HOLD_SECS, DEFAULT_HOLD_SECS),
+        )
+        if not self.coordinator.ir_queue.async_stream(steps):
+            raise HomeAssistantError(
+                "Too many IR commands queued, try again once the projector caught up"
+            )
@@ -0,0 +1,84 @@
+"""Priority scheduling of commands on the projector connection."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+import contextlib
+from enum import IntEnum
+import heapq
+import itertools
+import time
+
+from .const import COMMAND_MIN_INTERVAL
+
+
+class Priority(IntEnum):
+    """Command priority, lower runs first."""
+
+    INTERACTIVE = 0
+    VERIFY = 1
+    POLL = 2
+
+
+class CommandScheduler:
+    """Grant the projector connection to one command at a time.
+
+    Waiting commands are served by priority, then in arrival order, and
+    consecutive commands are spaced at least min_interval apart so the
+    projector is never sent more than it can handle.
+    """
+
+    def __init__(self, min_interval: float = COMMAND_MIN_INTERVAL) -> None:
+        """Initialize the scheduler."""
+        self.min_interval = min_interval
+        self._busy = False
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._released_at = 0.0
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of commands waiting for the connection."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    @contextlib.asynccontextmanager
+    async def async_slot(self, priority: Priority) -> AsyncIterator[None]:
+        """Hold the connection for one command."""
+        await self._async_acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: Priority) -> None:
+        """Wait for our turn, then for the rate limit."""
+        if self._busy or self._waiters:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Cancelled right after being granted the slot; pass it on
+                    self._release()
+                raise
+        else:
+            self._busy = True
+
+        try:
+            if (delay := self._released_at + self.min_interval - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the connection to the next waiter."""
+        self._released_at = time.monotonic()
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy = False
@@ -0,0 +1,164 @@
+"""Listener for Sony SDAP advertisement broadcasts."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+import socket
+from struct import unpack_from
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+from .const import DOMAIN, SDAP_PORT
+from .sdcp import decode_power
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SDAP = f"{DOMAIN}_sdap"
+
+_SDAP_ID = b"DA"
+_SDAP_MIN_LEN = 26
+
+
+@dataclass(frozen=True, slots=True)
+class SDAPAdvertisement:
+    """A decoded SDAP advertisement packet."""
+
+    host: str
+    product_name: str
+    serial_number: int
+    power_state: int
+    location: str
+    community: str
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the advertised power state is on or warming up."""
+        return decode_power(self.power_state)
+
+
+def _decode_text(buf: bytes) -> str:
+    """Decode a NUL padded text field."""
+    return buf.split(b"\x00", 1)[0].decode("ascii", errors="replace").strip()
+
+
+def parse_advertisement(data: bytes, host: str) -> SDAPAdvertisement | None:
+    """Decode an SDAP packet, or return None if it is not one."""
+    if len(data) < _SDAP_MIN_LEN or data[:2] != _SDAP_ID:
+        return None
+    serial_number, power_state = unpack_from(">IH", data, 20)
+    return SDAPAdvertisement(
+        host=host,
+        product_name=_decode_text(data[8:20]),
+        serial_number=serial_number,
+        power_state=power_state,
+        location=_decode_text(data[26:]),
+        community=_decode_text(data[4:8]),
+    )
+
+
+AdvertisementCallback = Callable[[SDAPAdvertisement], None]
+
+
+class SDAPListener(asyncio.DatagramProtocol):
+    """UDP listener dispatching SDAP advertisements to subscribers by host."""
+
+    def __init__(self, port: int = SDAP_PORT) -> None:
+        """Initialize the listener."""
+        self.port = port
+        self._transport: asyncio.DatagramTransport | None = None
+        # host -> callbacks; None subscribes to every projector
+        self._subscribers: dict[str | None, list[AdvertisementCallback]] = {}
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Return True if anyone is subscribed."""
+        return bool(self._subscribers)
+
+    async def async_start(self) -> None:
+        """Bind the UDP socket."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.setblocking(False)
+        try:
+            sock.bind(("", self.port))
+        except OSError:
+            sock.close()
+            raise
+        await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: self, sock=sock
+        )
+
+    def stop(self) -> None:
+        """Close the UDP socket."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def subscribe(
+        self, host: str | None, callback: AdvertisementCallback
+    ) -> CALLBACK_TYPE:
+        """Subscribe to advertisements from a host, or all hosts if None."""
+        self._subscribers.setdefault(host, []).append(callback)
+
+        def _unsubscribe() -> None:
+            callbacks = self._subscribers.get(host, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                self._subscribers.pop(host, None)
+
+        return _unsubscribe
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Store the transport."""
+        self._transport = transport
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Decode an advertisement and notify subscribers."""
+        advertisement = parse_advertisement(data, addr[0])
+        if advertisement is None:
+            return
+        for callback in [
+            *self._subscribers.get(addr[0], ()),
+            *self._subscribers.get(None, ()),
+        ]:
+            callback(advertisement)
+
+
+async def async_subscribe(
+    hass: HomeAssistant, host: str | None, callback: AdvertisementCallback
+) -> CALLBACK_TYPE | None:
+    """Subscribe to the shared SDAP listener, starting it if needed.
+
+    Returns None if the SDAP port cannot be bound; callers fall back to
+    polling in that case.
+    """
+    listener: SDAPListener | None = hass.data.get(DATA_SDAP)
+    if listener is None:
+        listener = hass.data[DATA_SDAP] = SDAPListener()
+        try:
+            await listener.async_start()
+        except OSError as err:
+            hass.data.pop(DATA_SDAP, None)
+            _LOGGER.warning(
+                "Unable to listen for SDAP advertisements on port %s: %s",
+                SDAP_PORT,
+                err,
+            )
+            return None
+
+    unsubscribe = listener.subscribe(host, callback)
+
+    def _unsubscribe() -> None:
+        unsubscribe()
+        if not listener.has_subscribers:
+            listener.stop()
+            if hass.data.get(DATA_SDAP) is listener:
+                hass.data.pop(DATA_SDAP)
+
+    return _unsubscribe
@@ -0,0 +1,448 @@
+"""Asyncio client for the Sony SDCP (PJ Talk) protocol."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping, Sequence
+import contextlib
+import logging
+import time
+from struct import pack, unpack_from
+from types import MappingProxyType
+
+from pysdcp_extended.protocol import (
+    ACTIONS,
+    COMMANDS,
+    INPUTS,
+    PICTURE_MUTING,
+    POWER_STATUS,
+    RESPONSE_ERRORS,
+)
+
+from .circuit import CircuitBreaker
+from .const import DEFAULT_TIMEOUT, SDCP_COMMUNITY, SDCP_PORT, SEQUENCE_MAX_HOLD
+from .metrics import SDCPMetrics
+from .scheduler import CommandScheduler, Priority
+
+_LOGGER = logging.getLogger(__name__)
+
+_VERSION = 2
+_CATEGORY = 10
+_HEADER_LEN = 10
+
+# IR commands (PROJECTOR=17, PROJECTOR-E=19, PROJECTOR-EE=1B) get no response
+_IR_CATEGORIES = (0x17, 0x19, 0x1B)
+
+_POWER_OFF_STATES = (
+    POWER_STATUS["STANDBY"],
+    POWER_STATUS["COOLING"],
+    POWER_STATUS["COOLING2"],
+)
+
+_INPUT_NAMES = {
+    INPUTS["HDMI1"]: "HDMI 1",
+    INPUTS["HDMI2"]: "HDMI 2",
+}
+
+
+class SDCPError(Exception):
+    """Base error for SDCP communication."""
+
+
+class SDCPConnectionError(SDCPError):
+    """Error raised when the projector cannot be reached."""
+
+
+class SDCPUnavailableError(SDCPConnectionError):
+    """Error raised without contacting the projector while it is unreachable."""
+
+
+class SDCPTimeoutError(SDCPError):
+    """Error raised when the projector does not answer in time."""
+
+
+class SDCPDataError(SDCPError):
+    """Error raised when a response does not carry the expected data."""
+
+
+class SDCPResponseError(SDCPError):
+    """Error raised when the projector answers with a failure status."""
+
+    def __init__(self, command: int, code: int | None) -> None:
+        """Initialize the error."""
+        if code is None:
+            message = "No error code"
+        else:
+            message = RESPONSE_ERRORS.get(code, f"Unknown error code: {code:x}")
+        super().__init__(
+            f"Received failed status from projector while sending command 0x{command:04x}. {message}"
+        )
+        self.command = command
+        self.code = code
+
+
+def decode_power(data: int | None) -> bool:
+    """Return True if a power status means the projector is on or warming up."""
+    return data not in _POWER_OFF_STATES
+
+
+def decode_muting(data: int | None) -> bool:
+    """Return True if a picture muting status means muting is on."""
+    return data != PICTURE_MUTING["OFF"]
+
+
+def decode_lamp_hours(data: int | None) -> int:
+    """Return the lamp timer in hours."""
+    return int(data)
+
+
+def decode_input(data: int | None) -> str | None:
+    """Return the HDMI input display name for an input status."""
+    return _INPUT_NAMES.get(data)
+
+
+def is_ir_command(command: int) -> bool:
+    """Return True if the command is a simulated IR command without response."""
+    return command >> 8 in _IR_CATEGORIES
+
+
+def build_frame(
+    action: int,
+    command: int,
+    data: int | None = None,
+    community: str = SDCP_COMMUNITY,
+) -> bytes:
+    """Build an SDCP request frame."""
+    header = pack(">BB4sBH", _VERSION, _CATEGORY, community.encode("ascii"), action, command)
+    if data is None:
+        return header + b"\x00"
+    return header + pack(">BH", 2, data)
+
+
+def build_frame_table(
+    requests: Iterable[tuple[int, int, int | None]],
+    community: str = SDCP_COMMUNITY,
+) -> Mapping[tuple[int, int, int | None], bytes]:
+    """Build the frames of (action, command, data) requests up front."""
+    return MappingProxyType(
+        {request: build_frame(*request, community) for request in requests}
+    )
+
+
+def parse_response(frame: bytes) -> tuple[bool, int, int | None]:
+    """Parse an SDCP response frame into (success, command, data)."""
+    is_success = bool(frame[6])
+    command, data_len = unpack_from(">HB", frame, 7)
+    data = unpack_from(">H", frame, _HEADER_LEN)[0] if data_len else None
+    return is_success, command, data
+
+
+class SDCPClient:
+    """Asyncio SDCP client for a single projector.
+
+    One TCP connection is kept open and reused across commands. A connection
+    the projector dropped while idle is detected on the next command and
+    replaced. Every command is bounded by timeout, and once the projector
+    keeps failing the circuit breaker refuses commands without any I/O
+    until it is time to probe it again.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = SDCP_PORT,
+        community: str = SDCP_COMMUNITY,
+        timeout: float = DEFAULT_TIMEOUT,
+        requests: Iterable[tuple[int, int, int | None]] = (),
+    ) -> None:
+        """Initialize the client.
+
+        The frames of the given (action, command, data) requests are built
+        once here; any other request is encoded when it is sent.
+        """
+        self.host = host
+        self.port = port
+        self.community = community
+        self.timeout = timeout
+        self._frames = build_frame_table(requests, community)
+        # The projector only handles one command at a time
+        self.scheduler = CommandScheduler()
+        self.metrics = SDCPMetrics()
+        self.circuit = CircuitBreaker()
+        # Timing of the command holding the connection, for the metrics
+        self._connect_time: float | None = None
+        self._retried = False
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Return True if a connection to the projector is open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def async_send(
+        self,
+        action: int,
+        command: int,
+        data: int | None = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> int | None:
+        """Send a command and return the response data."""
+        if self.circuit.blocked:
+            self.circuit.rejected += 1
+            raise self._unavailable_error()
+        queued = time.monotonic()
+        async with self.scheduler.async_slot(priority):
+            return await self._async_send_in_slot(action, command, data, queued)
+
+    async def _async_send_in_slot(
+        self, action: int, command: int, data: int | None, queued: float
+    ) -> int | None:
+        """Send a command while holding the connection slot, tracking the outcome."""
+        # The circuit may have opened while this command was queued
+        if not self.circuit.allow():
+            raise self._unavailable_error()
+        started = time.monotonic()
+        self._connect_time = None
+        self._retried = False
+        error: BaseException | None = None
+        try:
+            response = await self._async_send_locked(action, command, data)
+        except (SDCPConnectionError, SDCPTimeoutError) as err:
+            error = err
+            self.circuit.record_failure()
+            raise
+        except SDCPResponseError as err:
+            # The projector answered, so it is reachable
+            error = err
+            self.circuit.record_success()
+            raise
+        except BaseException as err:
+            error = err
+            self.circuit.record_aborted()
+            raise
+        else:
+            self.circuit.record_success()
+            return response
+        finally:
+            connect = self._connect_time
+            self.metrics.record(
+                command,
+                queue_wait=started - queued,
+                connect=connect,
+                round_trip=time.monotonic() - started - (connect or 0.0),
+                error=error,
+                retried=self._retried,
+            )
+
+    def _unavailable_error(self) -> SDCPUnavailableError:
+        """Return the error for a command refused by the circuit breaker."""
+        return SDCPUnavailableError(
+            f"{self.host} is unreachable, next attempt in {self.circuit.retry_in:.0f}s"
+        )
+
+    async def async_send_batch(
+        self,
+        requests: Sequence[tuple[int, int, int | None]],
+        priority: Priority = Priority.POLL,
+    ) -> list[int | None | SDCPError]:
+        """Send (action, command, data) requests back to back on one session.
+
+        Each request takes its own turn on the connection, so commands of a
+        higher priority can slip in between. Each entry of the result is
+        either the response data or the error for that request; once the
+        connection fails, the remaining requests fail with the same error
+        instead of waiting for timeouts.
+        """
+        results: list[int | None | SDCPError] = []
+        for action, command, data in requests:
+            try:
+                results.append(await self.async_send(action, command, data, priority))
+            except SDCPResponseError as err:
+                results.append(err)
+            except SDCPError as err:
+                results.extend([err] * (len(requests) - len(results)))
+                break
+        return results
+
+    async def async_send_sequence(
+        self,
+        steps: Sequence[tuple[float, tuple[int, int, int | None]]],
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> list[int | None | SDCPError]:
+        """Send (delay, request) steps as one job on the connection.
+
+        The connection is held across the sequence, so no other command
+        gets in between, and each request is sent delay seconds after the
+        previous one finished. The connection is released during a delay
+        longer than SEQUENCE_MAX_HOLD, so a long pause does not hold up
+        polls and other commands. Results are as for async_send_batch.
+        """
+        if self.circuit.blocked:
+            self.circuit.rejected += 1
+            raise self._unavailable_error()
+        # Split into runs of steps close enough to hold the connection across
+        runs: list[list[tuple[float, tuple[int, int, int | None]]]] = []
+        for step in steps:
+            if not runs or step[0] > SEQUENCE_MAX_HOLD:
+                runs.append([])
+            runs[-1].append(step)
+
+        results: list[int | None | SDCPError] = []
+        for run in runs:
+            if (delay := run[0][0]) > 0:
+                await asyncio.sleep(delay)
+            queued = time.monotonic()
+            async with self.scheduler.async_slot(priority):
+                for index, (delay, (action, command, data)) in enumerate(run):
+                    if index and delay > 0:
+                        # Pacing is not time spent waiting for the connection
+                        await asyncio.sleep(delay)
+                        queued = time.monotonic()
+                    try:
+                        results.append(
+                            await self._async_send_in_slot(action, command, data, queued)
+                        )
+                    except SDCPResponseError as err:
+                        results.append(err)
+                    except SDCPError as err:
+                        results.extend([err] * (len(steps) - len(results)))
+                        return results
+                    queued = time.monotonic()
+        return results
+
+    async def _async_send_locked(
+        self, action: int, command: int, data: int | None
+    ) -> int | None:
+        """Send a command while holding the connection slot."""
+        frame = self._frames.get((action, command, data))
+        if frame is None:
+            frame = build_frame(action, command, data, self.community)
+        try:
+            async with asyncio.timeout(self.timeout):
+                return await self._async_exchange(
+                    frame, command, data is None and is_ir_command(command)
+                )
+        except TimeoutError as err:
+            self._disconnect()
+            raise SDCPTimeoutError(
+                f"Timeout while sending command 0x{command:04x}"
+            ) from err
+        except (OSError, asyncio.IncompleteReadError) as err:
+            self._disconnect()
+            raise SDCPConnectionError(
+                f"Error while sending command 0x{command:04x}: {err}"
+            ) from err
+        except SDCPResponseError:
+            # The whole response was read; the connection is still in step
+            raise
+        except BaseException:
+            # Cancelled or failed mid-exchange: an unread response may be
+            # left on the connection, which the next command would read
+            self._disconnect()
+            raise
+
+    async def async_close(self) -> None:
+        """Close the connection to the projector."""
+        async with self.scheduler.async_slot(Priority.INTERACTIVE):
+            writer = self._writer
+            self._disconnect()
+            if writer is not None:
+                with contextlib.suppress(OSError):
+                    await writer.wait_closed()
+
+    async def _async_exchange(
+        self, frame: bytes, command: int, fire_and_forget: bool
+    ) -> int | None:
+        """Send one frame over the shared connection and read its response."""
+        if self.connected and self._reader.at_eof():
+            _LOGGER.debug("Connection to %s was closed by the projector", self.host)
+            self._disconnect()
+
+        if self.connected:
+            try:
+                return await self._async_roundtrip(frame, command, fire_and_forget)
+            except (OSError, asyncio.IncompleteReadError) as err:
+                # Half-open socket: the projector dropped the idle connection
+                _LOGGER.debug("Reconnecting to %s after stale connection: %s", self.host, err)
+                self._disconnect()
+                self._retried = True
+
+        await self._async_connect()
+        return await self._async_roundtrip(frame, command, fire_and_forget)
+
+    async def _async_roundtrip(
+        self, frame: bytes, command: int, fire_and_forget: bool
+    ) -> int | None:
+        """Write a frame and read the matching response."""
+        self._writer.write(frame)
+        await self._writer.drain()
+        if fire_and_forget:
+            return None
+        header = await self._reader.readexactly(_HEADER_LEN)
+        response = header + await self._reader.readexactly(header[9])
+
+        is_success, response_command, data = parse_response(response)
+        if response_command != command:
+            raise SDCPConnectionError(
+                f"Received response to command 0x{response_command:04x} "
+                f"while waiting for 0x{command:04x}"
+            )
+        if not is_success:
+            raise SDCPResponseError(command, data)
+        return data
+
+    async def _async_connect(self) -> None:
+        """Open a new connection."""
+        started = time.monotonic()
+        try:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        finally:
+            self._connect_time = time.monotonic() - started
+
+    def _disconnect(self) -> None:
+        """Drop the current connection."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+
+    async def async_get(
+        self, command: int, priority: Priority = Priority.INTERACTIVE
+    ) -> int | None:
+        """Query an item."""
+        return await self.async_send(ACTIONS["GET"], command, priority=priority)
+
+    async def async_set(self, command: int, data: int) -> None:
+        """Set an item."""
+        await self.async_send(ACTIONS["SET"], command, data)
+
+    async def async_send_ir(self, command: int) -> None:
+        """Send a simulated IR command."""
+        await self.async_send(ACTIONS["SET"], command)
+
+    async def async_get_power(self) -> bool:
+        """Return True if the projector is on or warming up."""
+        return decode_power(await self.async_get(COMMANDS["GET_STATUS_POWER"]))
+
+    async def async_set_power(self, on: bool) -> None:
+        """Turn the projector on or off."""
+        await self.async_set(
+            COMMANDS["SET_POWER"],
+            POWER_STATUS["START_UP"] if on else POWER_STATUS["STANDBY"],
+        )
+
+    async def async_get_muting(self) -> bool:
+        """Return True if picture muting is on."""
+        return decode_muting(await self.async_get(COMMANDS["PICTURE_MUTING"]))
+
+    async def async_get_lamp_hours(self) -> int:
+        """Return the lamp timer in hours."""
+        return decode_lamp_hours(await self.async_get(COMMANDS["GET_STATUS_LAMP_TIMER"]))
+
+    async def async_get_input(self) -> str | None:
+        """Return the current HDMI input display name."""
+        return decode_input(await self.async_get(COMMANDS["INPUT"]))
+
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 
 from pysdcp_extended.protocol import (
-    ACTIONS,
+    ASPECT_RATIOS as PROTO_ASPECT_RATIOS,
     CALIBRATION_PRESETS as PROTO_CALIBRATION_PRESETS,
     COMMANDS,
     DYNAMIC_RANGES as PROTO_DYNAMIC_RANGES,
@@ -13,14 +13,16 @@ from pysdcp_extended.protocol import (
     ADVANCED_IRIS as PROTO_ADVANCED_IRIS,
     MOTIONFLOW as PROTO_MOTIONFLOW,
     HDR as PROTO_HDR,
+    INPUTS as PROTO_INPUTS,
     TWO_D_THREE_D_SELECT as PROTO_2D_3D,
     THREE_D_FORMATS as PROTO_3D_FORMATS,
     MENU_POSITIONS as PROTO_MENU_POSITIONS,
+    PICTURE_POSITIONS as PROTO_PICTURE_POSITIONS,
 )
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -52,7 +54,9 @@ from .const import (
     TWO_D_THREE_D_MAP,
     TWO_D_THREE_D_MODES,
 )
+from .capabilities import async_supported_entities
 from .coordinator import SonySDCPCoordinator
+from .state import item_mask
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -64,21 +68,35 @@ async def async_setup_entry(
 ) -> None:
     """Set up Sony SDCP select entities from a config entry."""
     coordinator: SonySDCPCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([
-        SonySDCPHDMIInputSelect(coordinator, entry),
-        SonySDCPAspectRatioSelect(coordinator, entry),
-        SonySDCPPicturePositionSelect(coordinator, entry),
-        SonySDCPCalibrationPresetSelect(coordinator, entry),
-        SonySDCPDynamicRangeSelect(coordinator, entry, "HDMI 1", "HDMI1_DYNAMIC_RANGE", "hdmi1_dynamic_range"),
-        SonySDCPDynamicRangeSelect(coordinator, entry, "HDMI 2", "HDMI2_DYNAMIC_RANGE", "hdmi2_dynamic_range"),
-        SonySDCPLampControlSelect(coordinator, entry),
-        SonySDCPAdvancedIrisSelect(coordinator, entry),
-        SonySDCPMotionFlowSelect(coordinator, entry),
-        SonySDCPHDRSelect(coordinator, entry),
-        SonySDCP2D3DSelect(coordinator, entry),
-        SonySDCP3DFormatSelect(coordinator, entry),
-        SonySDCPMenuPositionSelect(coordinator, entry),
-    ])
+    async_add_entities(
+        async_supported_entities(
+            hass,
+            entry,
+            Platform.SELECT,
+            coordinator.capabilities,
+            [
+                ("input", SonySDCPHDMIInputSelect(coordinator, entry)),
+                ("aspect_ratio", SonySDCPAspectRatioSelect(coordinator, entry)),
+                ("picture_position", SonySDCPPicturePositionSelect(coordinator, entry)),
+                ("calibration_preset", SonySDCPCalibrationPresetSelect(coordinator, entry)),
+                (
+                    "hdmi1_dynamic_range",
+                    SonySDCPDynamicRangeSelect(coordinator, entry, "HDMI 1", "HDMI1_DYNAMIC_RANGE", "hdmi1_dynamic_range"),
+                ),
+                (
+                    "hdmi2_dynamic_range",
+                    SonySDCPDynamicRangeSelect(coordinator, entry, "HDMI 2", "HDMI2_DYNAMIC_RANGE", "hdmi2_dynamic_range"),
+                ),
+                ("lamp_control", SonySDCPLampControlSelect(coordinator, entry)),
+                ("advanced_iris", SonySDCPAdvancedIrisSelect(coordinator, entry)),
+                ("motionflow", SonySDCPMotionFlowSelect(coordinator, entry)),
+                ("hdr", SonySDCPHDRSelect(coordinator, entry)),
+                ("2d_3d_display", SonySDCP2D3DSelect(coordinator, entry)),
+                ("3d_format", SonySDCP3DFormatSelect(coordinator, entry)),
+                ("menu_position", SonySDCPMenuPositionSelect(coordinator, entry)),
+            ],
+        )
+    )
 
 
 def _make_device_info(entry: ConfigEntry) -> dict:
@@ -103,22 +121,19 @@ class SonySDCPHDMIInputSelect(CoordinatorEntity[SonySDCPCoordinator], SelectEnti
     _attr_options = HDMI_INPUTS
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("input"))
         self._attr_unique_id = f"{entry.entry_id}_hdmi_input"
         self._attr_device_info = _make_device_info(entry)
 
     @property
     def current_option(self) -> str | None:
         if self.coordinator.data:
-            return self.coordinator.data.get("input")
+            return self.coordinator.data.input
         return None
 
     async def async_select_option(self, option: str) -> None:
-        hdmi_num = HDMI_INPUT_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector.set_HDMI_input, hdmi_num
-        )
-        await self.coordinator.async_request_refresh()
+        value = HDMI_INPUT_MAP[option]
+        await self.coordinator.async_set(COMMANDS["INPUT"], PROTO_INPUTS[value])
 
 
 # ---------------------------------------------------------------------------
@@ -132,20 +147,23 @@ class SonySDCPAspectRatioSelect(CoordinatorEntity[SonySDCPCoordinator], SelectEn
     _attr_name = "Aspect Ratio"
     _attr_icon = "mdi:aspect-ratio"
     _attr_options = ASPECT_RATIOS
-    _attr_current_option = None
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("aspect_ratio"))
         self._attr_unique_id = f"{entry.entry_id}_aspect_ratio"
         self._attr_device_info = _make_device_info(entry)
 
+    @property
+    def current_option(self) -> str | None:
+        if self.coordinator.data:
+            return self.coordinator.data.aspect_ratio
+        return None
+
     async def async_select_option(self, option: str) -> None:
         value = ASPECT_RATIO_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector.set_screen, "ASPECT_RATIO", value
+        await self.coordinator.async_set(
+            COMMANDS["ASPECT_RATIO"], PROTO_ASPECT_RATIOS[value]
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
 
 
 # ---------------------------------------------------------------------------
@@ -159,20 +177,23 @@ class SonySDCPPicturePositionSelect(CoordinatorEntity[SonySDCPCoordinator], Sele
     _attr_name = "Picture Position"
     _attr_icon = "mdi:image-move"
     _attr_options = PICTURE_POSITIONS
-    _attr_current_option = None
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("picture_position"))
         self._attr_unique_id = f"{entry.entry_id}_picture_position"
         self._attr_device_info = _make_device_info(entry)
 
+    @property
+    def current_option(self) -> str | None:
+        if self.coordinator.data:
+            return self.coordinator.data.picture_position
+        return None
+
     async def async_select_option(self, option: str) -> None:
         value = PICTURE_POSITION_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector.set_screen, "PICTURE_POSITION", value
+        await self.coordinator.async_set(
+            COMMANDS["PICTURE_POSITION"], PROTO_PICTURE_POSITIONS[value]
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
 
 
 # ---------------------------------------------------------------------------
@@ -186,23 +207,23 @@ class SonySDCPCalibrationPresetSelect(CoordinatorEntity[SonySDCPCoordinator], Se
     _attr_name = "Calibration Preset"
     _attr_icon = "mdi:palette"
     _attr_options = CALIBRATION_PRESETS
-    _attr_current_option = None
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("calibration_preset"))
         self._attr_unique_id = f"{entry.entry_id}_calibration_preset"
         self._attr_device_info = _make_device_info(entry)
 
+    @property
+    def current_option(self) -> str | None:
+        if self.coordinator.data:
+            return self.coordinator.data.calibration_preset
+        return None
+
     async def async_select_option(self, option: str) -> None:
         value = CALIBRATION_PRESET_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS["CALIBRATION_PRESET"],
-            PROTO_CALIBRATION_PRESETS[value],
+        await self.coordinator.async_set(
+            COMMANDS["CALIBRATION_PRESET"], PROTO_CALIBRATION_PRESETS[value]
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
 
 
 # ---------------------------------------------------------------------------
@@ -215,7 +236,6 @@ class SonySDCPDynamicRangeSelect(CoordinatorEntity[SonySDCPCoordinator], SelectE
     _attr_has_entity_name = True
     _attr_icon = "mdi:contrast-box"
     _attr_options = DYNAMIC_RANGES
-    _attr_current_option = None
 
     def __init__(
         self,
@@ -225,22 +245,24 @@ class SonySDCPDynamicRangeSelect(CoordinatorEntity[SonySDCPCoordinator], SelectE
         command_key: str,
         uid_suffix: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask(uid_suffix))
         self._attr_name = f"{hdmi_label} Dynamic Range"
         self._attr_unique_id = f"{entry.entry_id}_{uid_suffix}"
         self._attr_device_info = _make_device_info(entry)
         self._command_key = command_key
+        self._data_key = uid_suffix
+
+    @property
+    def current_option(self) -> str | None:
+        if self.coordinator.data:
+            return self.coordinator.data.get(self._data_key)
+        return None
 
     async def async_select_option(self, option: str) -> None:
         value = DYNAMIC_RANGE_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS[self._command_key],
-            PROTO_DYNAMIC_RANGES[value],
+        await self.coordinator.async_set(
+            COMMANDS[self._command_key], PROTO_DYNAMIC_RANGES[value]
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
 
 
 # ---------------------------------------------------------------------------
@@ -254,23 +276,23 @@ class SonySDCPLampControlSelect(CoordinatorEntity[SonySDCPCoordinator], SelectEn
     _attr_name = "Lamp Control"
     _attr_icon = "mdi:lightbulb-outline"
     _attr_options = LAMP_CONTROLS
-    _attr_current_option = None
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("lamp_control"))
         self._attr_unique_id = f"{entry.entry_id}_lamp_control"
         self._attr_device_info = _make_device_info(entry)
 
+    @property
+    def current_option(self) -> str | None:
+        if self.coordinator.data:
+            return self.coordinator.data.lamp_control
+        return None
+
     async def async_select_option(self, option: str) -> None:
         value = LAMP_CONTROL_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS["LAMP_CONTROL"],
-            PROTO_LAMP_CONTROL[value],
+        await self.coordinator.async_set(
+            COMMANDS["LAMP_CONTROL"], PROTO_LAMP_CONTROL[value]
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
 
 
 # ---------------------------------------------------------------------------
@@ -284,23 +306,23 @@ class SonySDCPAdvancedIrisSelect(CoordinatorEntity[SonySDCPCoordinator], SelectE
     _attr_name = "Advanced Iris"
     _attr_icon = "mdi:eye-settings"
     _attr_options = ADVANCED_IRIS_MODES
-    _attr_current_option = None
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("advanced_iris"))
         self._attr_unique_id = f"{entry.entry_id}_advanced_iris"
         self._attr_device_info = _make_device_info(entry)
 
+    @property
+    def current_option(self) -> str | None:
+        if self.coordinator.data:
+            return self.coordinator.data.advanced_iris
+        return None
+
     async def async_select_option(self, option: str) -> None:
         value = ADVANCED_IRIS_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS["ADVANCED_IRIS"],
-            PROTO_ADVANCED_IRIS[value],
+        await self.coordinator.async_set(
+            COMMANDS["ADVANCED_IRIS"], PROTO_ADVANCED_IRIS[value]
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
 
 
 # ---------------------------------------------------------------------------
@@ -314,23 +336,23 @@ class SonySDCPMotionFlowSelect(CoordinatorEntity[SonySDCPCoordinator], SelectEnt
     _attr_name = "MotionFlow"
     _attr_icon = "mdi:motion"
     _attr_options = MOTIONFLOW_MODES
-    _attr_current_option = None
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("motionflow"))
         self._attr_unique_id = f"{entry.entry_id}_motionflow"
         self._attr_device_info = _make_device_info(entry)
 
+    @property
+    def current_option(self) -> str | None:
+        if self.coordinator.data:
+            return self.coordinator.data.motionflow
+        return None
+
     async def async_select_option(self, option: str) -> None:
         value = MOTIONFLOW_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS["MOTIONFLOW"],
-            PROTO_MOTIONFLOW[value],
+        await self.coordinator.async_set(
+            COMMANDS["MOTIONFLOW"], PROTO_MOTIONFLOW[value]
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
 
 
 # ---------------------------------------------------------------------------
@@ -344,23 +366,23 @@ class SonySDCPHDRSelect(CoordinatorEntity[SonySDCPCoordinator], SelectEntity):
     _attr_name = "HDR"
     _attr_icon = "mdi:hdr"
     _attr_options = HDR_MODES
-    _attr_current_option = None
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("hdr"))
         self._attr_unique_id = f"{entry.entry_id}_hdr"
         self._attr_device_info = _make_device_info(entry)
 
+    @property
+    def current_option(self) -> str | None:
+        if self.coordinator.data:
+            return self.coordinator.data.hdr
+        return None
+
     async def async_select_option(self, option: str) -> None:
         value = HDR_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS["HDR"],
-            PROTO_HDR[value],
+        await self.coordinator.async_set(
+            COMMANDS["HDR"], PROTO_HDR[value]
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
 
 
 # ---------------------------------------------------------------------------
@@ -374,23 +396,23 @@ class SonySDCP2D3DSelect(CoordinatorEntity[SonySDCPCoordinator], SelectEntity):
     _attr_name = "2D/3D Display"
     _attr_icon = "mdi:video-3d"
     _attr_options = TWO_D_THREE_D_MODES
-    _attr_current_option = None
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("2d_3d_display"))
         self._attr_unique_id = f"{entry.entry_id}_2d_3d_display"
         self._attr_device_info = _make_device_info(entry)
 
+    @property
+    def current_option(self) -> str | None:
+        if self.coordinator.data:
+            return self.coordinator.data.display_2d_3d
+        return None
+
     async def async_select_option(self, option: str) -> None:
         value = TWO_D_THREE_D_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS["2D_3D_DISPLAY_SELECT"],
-            PROTO_2D_3D[value],
+        await self.coordinator.async_set(
+            COMMANDS["2D_3D_DISPLAY_SELECT"], PROTO_2D_3D[value]
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
 
 
 # ---------------------------------------------------------------------------
@@ -404,23 +426,23 @@ class SonySDCP3DFormatSelect(CoordinatorEntity[SonySDCPCoordinator], SelectEntit
     _attr_name = "3D Format"
     _attr_icon = "mdi:video-3d-variant"
     _attr_options = THREE_D_FORMATS
-    _attr_current_option = None
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("3d_format"))
         self._attr_unique_id = f"{entry.entry_id}_3d_format"
         self._attr_device_info = _make_device_info(entry)
 
+    @property
+    def current_option(self) -> str | None:
+        if self.coordinator.data:
+            return self.coordinator.data.format_3d
+        return None
+
     async def async_select_option(self, option: str) -> None:
         value = THREE_D_FORMAT_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS["3D_FORMAT"],
-            PROTO_3D_FORMATS[value],
+        await self.coordinator.async_set(
+            COMMANDS["3D_FORMAT"], PROTO_3D_FORMATS[value]
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
 
 
 # ---------------------------------------------------------------------------
@@ -434,20 +456,20 @@ class SonySDCPMenuPositionSelect(CoordinatorEntity[SonySDCPCoordinator], SelectE
     _attr_name = "Menu Position"
     _attr_icon = "mdi:menu"
     _attr_options = MENU_POSITIONS
-    _attr_current_option = None
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("menu_position"))
         self._attr_unique_id = f"{entry.entry_id}_menu_position"
         self._attr_device_info = _make_device_info(entry)
 
+    @property
+    def current_option(self) -> str | None:
+        if self.coordinator.data:
+            return self.coordinator.data.menu_position
+        return None
+
     async def async_select_option(self, option: str) -> None:
         value = MENU_POSITION_MAP[option]
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS["MENU_POSITION"],
-            PROTO_MENU_POSITIONS[value],
+        await self.coordinator.async_set(
+            COMMANDS["MENU_POSITION"], PROTO_MENU_POSITIONS[value]
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
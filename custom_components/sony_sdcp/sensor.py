@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_NAME, EntityCategory, Platform, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .capabilities import async_supported_entities
 from .coordinator import SonySDCPCoordinator
+from .state import item_mask
 
 
 async def async_setup_entry(
@@ -20,7 +26,19 @@ async def async_setup_entry(
 ) -> None:
     """Set up Sony SDCP sensors from a config entry."""
     coordinator: SonySDCPCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([SonySDCPLampHoursSensor(coordinator, entry)])
+    async_add_entities([
+        *async_supported_entities(
+            hass,
+            entry,
+            Platform.SENSOR,
+            coordinator.capabilities,
+            [("lamp_hours", SonySDCPLampHoursSensor(coordinator, entry))],
+        ),
+        SonySDCPLatencySensor(coordinator, entry, "Command Latency p50", "round_trip", 0.5),
+        SonySDCPLatencySensor(coordinator, entry, "Command Latency p99", "round_trip", 0.99),
+        SonySDCPLatencySensor(coordinator, entry, "Command Queue Wait p99", "queue_wait", 0.99),
+        SonySDCPCommandErrorsSensor(coordinator, entry),
+    ])
 
 
 class SonySDCPLampHoursSensor(CoordinatorEntity[SonySDCPCoordinator], SensorEntity):
@@ -33,7 +51,7 @@ class SonySDCPLampHoursSensor(CoordinatorEntity[SonySDCPCoordinator], SensorEnti
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("lamp_hours"))
         self._attr_unique_id = f"{entry.entry_id}_lamp_hours"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
@@ -45,7 +63,83 @@ class SonySDCPLampHoursSensor(CoordinatorEntity[SonySDCPCoordinator], SensorEnti
     def native_value(self) -> int | None:
         if self.coordinator.data is None:
             return None
-        value = self.coordinator.data.get("lamp_hours")
+        return self.coordinator.data.lamp_hours
+
+
+class SonySDCPLatencySensor(CoordinatorEntity[SonySDCPCoordinator], SensorEntity):
+    """Diagnostic sensor for a percentile of SDCP command latency."""
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Changes on nearly every poll, so only record it when asked to
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: SonySDCPCoordinator,
+        entry: ConfigEntry,
+        name: str,
+        histogram: str,
+        fraction: float,
+    ) -> None:
+        super().__init__(coordinator)
+        self._histogram = histogram
+        self._fraction = fraction
+        self._attr_name = name
+        self._attr_unique_id = f"{entry.entry_id}_{histogram}_p{round(fraction * 100)}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": entry.data[CONF_NAME],
+            "manufacturer": "Sony",
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        histogram = getattr(self.coordinator.client.metrics.total, self._histogram)
+        value = histogram.percentile(self._fraction)
         if value is not None:
-            return int(value)
+            return value * 1000
         return None
+
+
+class SonySDCPCommandErrorsSensor(CoordinatorEntity[SonySDCPCoordinator], SensorEntity):
+    """Diagnostic sensor counting failed SDCP commands."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Command Errors"
+    _attr_icon = "mdi:alert-circle-outline"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        # Last written error counts and availability
+        self._written: tuple[dict[str, int], bool] | None = None
+        self._attr_unique_id = f"{entry.entry_id}_command_errors"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": entry.data[CONF_NAME],
+            "manufacturer": "Sony",
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability or the error counts changed."""
+        written = (dict(self.coordinator.client.metrics.total.errors), self.available)
+        if written == self._written:
+            return
+        self._written = written
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> int:
+        return self.coordinator.client.metrics.error_count
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        return dict(self.coordinator.client.metrics.total.errors)
@@ -0,0 +1,99 @@
+"""Services for the Sony SDCP integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import functools
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .const import DOMAIN
+from .coordinator import PROFILE_SETTINGS, SonySDCPCoordinator
+from .macro import Macro, compile_macro
+
+SERVICE_APPLY_PROFILE = "apply_profile"
+SERVICE_RUN_MACRO = "run_macro"
+
+ATTR_SEQUENCE = "sequence"
+
+APPLY_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        **{
+            vol.Optional(item): cv.boolean if True in values else vol.In(list(values))
+            for item, (_, values) in PROFILE_SETTINGS.items()
+        },
+    }
+)
+
+RUN_MACRO_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        # Compiled once here, so the handler only has to send it
+        vol.Required(ATTR_SEQUENCE): vol.All(
+            cv.ensure_list, functools.partial(compile_macro, settings=PROFILE_SETTINGS)
+        ),
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, device_id: str) -> SonySDCPCoordinator:
+    """Return the coordinator of the projector behind a device."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is not None:
+        for domain, entry_id in device.identifiers:
+            if domain == DOMAIN and entry_id in hass.data.get(DOMAIN, {}):
+                return hass.data[DOMAIN][entry_id]
+    raise ServiceValidationError(f"{device_id} is not a loaded Sony SDCP projector")
+
+
+def _check_supported(coordinator: SonySDCPCoordinator, items: Iterable[str]) -> None:
+    """Raise if the projector does not support any of the settings."""
+    # dict.fromkeys drops repeated macro steps, keeping their order
+    unsupported = [item for item in dict.fromkeys(items) if not coordinator.supports(item)]
+    if unsupported:
+        raise ServiceValidationError(
+            f"Not supported by {coordinator.model or 'this projector'}: "
+            + ", ".join(unsupported)
+        )
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Sony SDCP services."""
+
+    async def async_apply_profile(call: ServiceCall) -> None:
+        """Apply a set of projector settings in one burst."""
+        settings = dict(call.data)
+        coordinator = _get_coordinator(hass, settings.pop(ATTR_DEVICE_ID))
+        _check_supported(coordinator, settings)
+        result = await coordinator.async_apply_profile(settings)
+        if not result.ok:
+            raise HomeAssistantError(
+                "Failed to apply "
+                + ", ".join(f"{item} ({err})" for item, err in result.errors.items())
+            )
+
+    async def async_run_macro(call: ServiceCall) -> None:
+        """Run a sequence of IR keys and settings as one job."""
+        coordinator = _get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        macro: Macro = call.data[ATTR_SEQUENCE]
+        _check_supported(coordinator, (step.name for step in macro.steps if not step.is_ir))
+        result = await coordinator.async_run_macro(macro)
+        if not result.ok:
+            raise HomeAssistantError(
+                "Macro steps failed: "
+                + ", ".join(f"{name} ({err})" for name, err in result.errors.items())
+            )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_APPLY_PROFILE, async_apply_profile, schema=APPLY_PROFILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_RUN_MACRO, async_run_macro, schema=RUN_MACRO_SCHEMA
+    )
@@ -0,0 +1,95 @@
+"""Immutable snapshots of projector state for Sony SDCP."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectorState:
+    """Snapshot of everything known about a projector.
+
+    A snapshot derived with evolve() carries a version one higher than the
+    one it came from and a bit mask of the items that differ from it.
+    None means the item is unknown.
+    """
+
+    power_status: int | None = None
+    power: bool | None = None
+    muting: bool | None = None
+    lamp_hours: int | None = None
+    input: str | None = None
+    aspect_ratio: str | None = None
+    picture_position: str | None = None
+    calibration_preset: str | None = None
+    hdmi1_dynamic_range: str | None = None
+    hdmi2_dynamic_range: str | None = None
+    lamp_control: str | None = None
+    advanced_iris: str | None = None
+    motionflow: str | None = None
+    hdr: str | None = None
+    display_2d_3d: str | None = None
+    format_3d: str | None = None
+    menu_position: str | None = None
+    input_lag_reduction: bool | None = None
+    version: int = 0
+    changed: int = 0
+
+    def get(self, item: str, default: Any = None) -> Any:
+        """Return an item by its data key."""
+        if (name := _ITEM_FIELDS.get(item)) is None:
+            return default
+        value = getattr(self, name)
+        return default if value is None else value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the known items by data key."""
+        return {
+            item: value
+            for item, name in _ITEM_FIELDS.items()
+            if (value := getattr(self, name)) is not None
+        }
+
+    @property
+    def changed_items(self) -> frozenset[str]:
+        """Return the data keys that differ from the previous snapshot."""
+        return frozenset(item for item, bit in _ITEM_BITS.items() if self.changed & bit)
+
+    def evolve(self, values: Mapping[str, Any], replace: bool = False) -> ProjectorState:
+        """Return a snapshot with values applied, or self if nothing changed.
+
+        With replace, items missing from values become unknown.
+        """
+        new = {}
+        changed = 0
+        for item, name in _ITEM_FIELDS.items():
+            current = getattr(self, name)
+            value = values.get(item) if replace else values.get(item, current)
+            new[name] = value
+            if value != current:
+                changed |= _ITEM_BITS[item]
+        if not changed:
+            return self
+        return ProjectorState(**new, version=self.version + 1, changed=changed)
+
+
+# Fields whose data key is not a valid field name
+_FIELD_ITEMS = {"display_2d_3d": "2d_3d_display", "format_3d": "3d_format"}
+
+# Data key -> field name, and data key -> bit in the changed mask
+_ITEM_FIELDS = {
+    _FIELD_ITEMS.get(field.name, field.name): field.name
+    for field in fields(ProjectorState)
+    if field.name not in ("version", "changed")
+}
+_ITEM_BITS = {item: 1 << index for index, item in enumerate(_ITEM_FIELDS)}
+
+
+def item_mask(*items: str) -> int:
+    """Return the bit mask of the given data keys."""
+    mask = 0
+    for item in items:
+        mask |= _ITEM_BITS[item]
+    return mask
@@ -0,0 +1,101 @@
+"""Persistent last-known projector state for Sony SDCP."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+
+@dataclass(frozen=True, slots=True)
+class StoredState:
+    """Last known state of a projector."""
+
+    power_status: int | None
+    # item -> (value, wall clock time it was read)
+    items: dict[str, tuple[Any, float]]
+    # Calibrated macro delays after an IR key and after a setting
+    macro_timing: tuple[float, float] | None = None
+
+
+class _StateStorage(Store[dict[str, Any]]):
+    """Store that migrates older state files."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Migrate to the current version."""
+        if old_major_version == 1:
+            # Version 1 kept the coordinator data without read times
+            data = old_data.get("data") or {}
+            old_data = {
+                "power_status": data.get("power_status"),
+                "items": {
+                    item: [value, 0.0]
+                    for item, value in data.items()
+                    if item not in ("power_status", "power")
+                },
+            }
+        return old_data
+
+
+class SonySDCPStore:
+    """Keep the last known state of a projector across restarts.
+
+    Every item is stored with the time it was read, so after a restart
+    only the items that have since expired need to be read again.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store = _StateStorage(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+    async def async_load(self) -> StoredState | None:
+        """Return the stored state, or None if there is none."""
+        if (stored := await self._store.async_load()) is None:
+            return None
+        return StoredState(
+            power_status=stored.get("power_status"),
+            items={
+                item: (value, read_at)
+                for item, (value, read_at) in stored.get("items", {}).items()
+            },
+            macro_timing=tuple(timing)
+            if (timing := stored.get("macro_timing")) is not None
+            else None,
+        )
+
+    @callback
+    def async_delay_save(self, state_func: Callable[[], StoredState]) -> None:
+        """Save the state once it has settled for STORAGE_SAVE_DELAY seconds.
+
+        state_func is called when the state is written, so repeated calls
+        within the delay cost a single write of the latest state.
+        """
+        self._store.async_delay_save(
+            lambda: self._serialize(state_func()), STORAGE_SAVE_DELAY
+        )
+
+    async def async_save(self, state: StoredState) -> None:
+        """Save the state now, replacing any pending delayed save."""
+        await self._store.async_save(self._serialize(state))
+
+    @staticmethod
+    def _serialize(state: StoredState) -> dict[str, Any]:
+        """Return the data to write."""
+        return {
+            "power_status": state.power_status,
+            "items": {item: list(entry) for item, entry in state.items.items()},
+            "macro_timing": None
+            if state.macro_timing is None
+            else list(state.macro_timing),
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the stored state."""
+        await self._store.async_remove()
@@ -6,20 +6,22 @@ import logging
 from typing import Any
 
 from pysdcp_extended.protocol import (
-    ACTIONS,
     COMMANDS,
     INPUT_LAG_REDUCTION as PROTO_INPUT_LAG_REDUCTION,
+    PICTURE_MUTING as PROTO_PICTURE_MUTING,
 )
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .capabilities import async_supported_entities
 from .coordinator import SonySDCPCoordinator
+from .state import item_mask
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,8 +43,16 @@ async def async_setup_entry(
     coordinator: SonySDCPCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities([
         SonySDCPPowerSwitch(coordinator, entry),
-        SonySDCPPictureMutingSwitch(coordinator, entry),
-        SonySDCPInputLagReductionSwitch(coordinator, entry),
+        *async_supported_entities(
+            hass,
+            entry,
+            Platform.SWITCH,
+            coordinator.capabilities,
+            [
+                ("muting", SonySDCPPictureMutingSwitch(coordinator, entry)),
+                ("input_lag_reduction", SonySDCPInputLagReductionSwitch(coordinator, entry)),
+            ],
+        ),
     ])
 
 
@@ -58,7 +68,7 @@ class SonySDCPPowerSwitch(CoordinatorEntity[SonySDCPCoordinator], SwitchEntity):
     _attr_icon = "mdi:projector"
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("power"))
         self._attr_unique_id = f"{entry.entry_id}_power"
         self._attr_device_info = _make_device_info(entry)
 
@@ -66,19 +76,13 @@ class SonySDCPPowerSwitch(CoordinatorEntity[SonySDCPCoordinator], SwitchEntity):
     def is_on(self) -> bool | None:
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get("power")
+        return self.coordinator.data.power
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector.set_power, True
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_power(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector.set_power, False
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_power(False)
 
 
 # ---------------------------------------------------------------------------
@@ -93,7 +97,7 @@ class SonySDCPPictureMutingSwitch(CoordinatorEntity[SonySDCPCoordinator], Switch
     _attr_icon = "mdi:projector-off"
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("muting"))
         self._attr_unique_id = f"{entry.entry_id}_picture_muting"
         self._attr_device_info = _make_device_info(entry)
 
@@ -101,19 +105,17 @@ class SonySDCPPictureMutingSwitch(CoordinatorEntity[SonySDCPCoordinator], Switch
     def is_on(self) -> bool | None:
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get("muting")
+        return self.coordinator.data.muting
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector.set_muting, True
+        await self.coordinator.async_set(
+            COMMANDS["PICTURE_MUTING"], PROTO_PICTURE_MUTING["ON"]
         )
-        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector.set_muting, False
+        await self.coordinator.async_set(
+            COMMANDS["PICTURE_MUTING"], PROTO_PICTURE_MUTING["OFF"]
         )
-        await self.coordinator.async_request_refresh()
 
 
 # ---------------------------------------------------------------------------
@@ -126,34 +128,24 @@ class SonySDCPInputLagReductionSwitch(CoordinatorEntity[SonySDCPCoordinator], Sw
     _attr_has_entity_name = True
     _attr_name = "Input Lag Reduction"
     _attr_icon = "mdi:gamepad-variant"
-    _attr_current_option = None
 
     def __init__(self, coordinator: SonySDCPCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=item_mask("input_lag_reduction"))
         self._attr_unique_id = f"{entry.entry_id}_input_lag_reduction"
         self._attr_device_info = _make_device_info(entry)
-        self._is_on: bool | None = None
 
     @property
     def is_on(self) -> bool | None:
-        return self._is_on
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.input_lag_reduction
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS["INPUT_LAG_REDUCTION"],
-            PROTO_INPUT_LAG_REDUCTION["ON"],
+        await self.coordinator.async_set(
+            COMMANDS["INPUT_LAG_REDUCTION"], PROTO_INPUT_LAG_REDUCTION["ON"]
         )
-        self._is_on = True
-        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.hass.async_add_executor_job(
-            self.coordinator.projector._send_command,
-            ACTIONS["SET"],
-            COMMANDS["INPUT_LAG_REDUCTION"],
-            PROTO_INPUT_LAG_REDUCTION["OFF"],
+        await self.coordinator.async_set(
+            COMMANDS["INPUT_LAG_REDUCTION"], PROTO_INPUT_LAG_REDUCTION["OFF"]
         )
-        self._is_on = False
-        self.async_write_ha_state()